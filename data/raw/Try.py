@@ -1,23 +1,99 @@
-from pythonosc.udp_client import SimpleUDPClient
-import time
+import asyncio
+import socket
+import struct
 import math
 
 # Change the IP/port if your OSC server in Unreal listens on another port
 ip = "127.0.0.1"
 port = 9000
+addr = (ip, port)
 
-client = SimpleUDPClient(ip, port)
+PERIOD = 0.2  # seconds between frames
 
-print("Sending /mh/RightForeArm_roll test messages...")
+# struct.Struct parses ">f" / ">i" once; the module-level struct.pack would look it up per value
+_PACK_F = struct.Struct(">f").pack
+_PACK_I = struct.Struct(">i").pack
 
-# Loop: oscillate the value between -20 and +20 degrees
-while True:
+
+def osc_prefix(address):
+    """OSC address + ',f' type tag, each null-padded to a 4-byte boundary"""
+    padded = address.encode() + b"\0"
+    padded += b"\0" * (-len(padded) % 4)
+    return padded + b",f\0\0"
+
+
+# Prebuilt once: only the float payload changes per message
+BUNDLE_HEADER = b"#bundle\0" + struct.pack(">Q", 1)  # timetag 1 = immediately
+PREFIX_R = osc_prefix("/mh/RightForeArm_roll")
+PREFIX_L = osc_prefix("/mh/LeftForeArm_roll")
+
+
+def build_bundle(prefix_value_pairs):
+    """Assemble one frame's messages into a single OSC bundle datagram"""
+    parts = [BUNDLE_HEADER]
+    for prefix, value in prefix_value_pairs:
+        parts.append(_PACK_I(len(prefix) + 4))
+        parts.append(prefix)
+        parts.append(_PACK_F(value))
+    return b"".join(parts)
+
+
+def build_cycle():
+    """Prebuild one full sweep as (bundle, log line) pairs; every cycle is identical"""
+    frames = []
+    # Each frame carries both forearms; the arm that is not sweeping holds its last value
+    right_angle = 20.0
+    left_angle = -20.0
+
+    # Loop: oscillate the value between -20 and +20 degrees
     for angle in range(-20, 21, 5):  # -20, -15, ... 20
-        client.send_message("/mh/RightForeArm_roll", float(angle))
-        print(f"Sent: /mh/RightForeArm_roll {angle}")
-        time.sleep(0.2)
+        right_angle = float(angle)
+        frames.append((build_bundle([(PREFIX_R, right_angle), (PREFIX_L, left_angle)]),
+                       f"Sent: /mh/RightForeArm_roll {angle}"))
 
     for angle in range(20, -21, -5):  # 20, 15, ... -20
-        client.send_message("/mh/LeftForeArm_roll", float(angle))
-        print(f"Sent: /mh/LeftForeArm_roll {angle}")
-        time.sleep(0.2)
\ No newline at end of file
+        left_angle = float(angle)
+        frames.append((build_bundle([(PREFIX_R, right_angle), (PREFIX_L, left_angle)]),
+                       f"Sent: /mh/LeftForeArm_roll {angle}"))
+    return frames
+
+
+FRAMES = build_cycle()
+
+
+class SenderProtocol(asyncio.DatagramProtocol):
+    def error_received(self, exc):
+        # The connected socket reports ICMP port-unreachable while nothing is listening yet
+        if not isinstance(exc, ConnectionRefusedError):
+            print(f"Send error: {exc}")
+
+
+def send(transport, packet, label):
+    transport.sendto(packet)
+    print(label)
+
+
+async def stream():
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(SenderProtocol, remote_addr=addr)
+    sock = transport.get_extra_info("socket")
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)  # IPTOS_LOWDELAY
+
+    print("Sending /mh/RightForeArm_roll test messages...")
+
+    # Frames are scheduled against absolute loop-clock deadlines, so timing does not drift
+    next_tick = loop.time()
+    try:
+        while True:
+            for packet, label in FRAMES:
+                loop.call_at(next_tick, send, transport, packet, label)
+                next_tick += PERIOD
+
+            # Let this sweep go out before scheduling the next one
+            await asyncio.sleep(next_tick - loop.time())
+    finally:
+        transport.close()
+
+
+asyncio.run(stream())
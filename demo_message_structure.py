@@ -1,103 +1,130 @@
 #!/usr/bin/env python3
 """
-Demonstration of how the streamer sends individual OSC messages to Unreal Engine
+Demonstration of how the streamer packs its OSC messages into bundles for Unreal Engine
 """
 
-import json
+import sys
+from collections import Counter
 import numpy as np
+from pythonosc import osc_bundle_builder, osc_message_builder
+
+try:
+    import orjson as _json  # Optional: faster config parsing
+except ImportError:
+    import json as _json
+
+def build_frame_bundle(addr_value_pairs):
+    """Pack one frame's (address, value) pairs into a single OSC bundle"""
+    bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+    for address, value in addr_value_pairs:
+        msg = osc_message_builder.OscMessageBuilder(address=address)
+        msg.add_arg(value)
+        bundle.add_content(msg.build())
+    return bundle.build()
 
 def demonstrate_message_structure():
     """Show exactly how messages are structured and sent"""
+    # Collect the report and write it to stdout in one go
+    out = []
     
-    print("🎭 MetaHuman Streamer - Message Structure Demo")
-    print("=" * 60)
+    out.append("🎭 MetaHuman Streamer - Message Structure Demo")
+    out.append("=" * 60)
     
     # Load OSC configuration
-    with open('v2/osc_channels_config.json', 'r') as f:
-        config = json.load(f)
-    
-    print(f"📡 OSC Configuration:")
-    print(f"   Host: {config['meta']['osc']['host']}")
-    print(f"   Port: {config['meta']['osc']['port']}")
-    print(f"   Rate: {config['meta']['rate_hz']} Hz")
-    print(f"   Units: {config['meta']['units']}")
-    print()
-    
-    print("🔄 How Messages Are Sent:")
-    print("-" * 30)
-    print("The streamer sends INDIVIDUAL OSC messages, one per bone axis.")
-    print("It does NOT send one big message with all data.")
-    print()
+    with open('v2/osc_channels_config.json', 'rb') as f:
+        config = _json.loads(f.read())
+    
+    # Flatten channels once: (osc_address, source_column, scale, offset)
+    channels = [(c['osc_address'], c['source_column'], c['transform']['scale'], c['transform']['offset'])
+                for c in config['channels']]
+    addresses, _, scale_list, offset_list = zip(*channels)
+    
+    out.append(f"📡 OSC Configuration:")
+    out.append(f"   Host: {config['meta']['osc']['host']}")
+    out.append(f"   Port: {config['meta']['osc']['port']}")
+    out.append(f"   Rate: {config['meta']['rate_hz']} Hz")
+    out.append(f"   Units: {config['meta']['units']}")
+    out.append("")
+    
+    out.append("🔄 How Messages Are Sent:")
+    out.append("-" * 30)
+    out.append("The streamer builds one OSC message per bone axis, plus two control messages,")
+    out.append("and sends the whole frame as an OSC bundle: one UDP datagram per frame,")
+    out.append("split into more bundles only if a frame outgrows 1400 bytes.")
+    out.append("")
     
     # Simulate some sample data
     np.random.seed(42)  # For reproducible demo
     sample_data = np.random.normal(0, 1, 864)  # Simulated normalized data
     
-    print("📤 Example: One Frame (37 Individual Messages)")
-    print("=" * 50)
+    out.append("📤 Example: One Frame (37 Channel Messages)")
+    out.append("=" * 50)
     
     frame_count = 1
     mode = "TURNING_LEFT"
     
-    # Simulate sending messages
-    message_count = 0
-    for i, channel in enumerate(config['channels']):
-        source_column = channel['source_column']
-        osc_address = channel['osc_address']
-        transform = channel['transform']
-        
-        # Simulate getting value from data
-        raw_value = sample_data[i % len(sample_data)]
-        
-        # Apply transform
-        transformed_value = transform['scale'] * raw_value + transform['offset']
-        
-        # Format the message
-        message_count += 1
-        print(f"{message_count:2d}. {osc_address:25s} = {transformed_value:8.3f}°")
-        
-        # Show first 10 messages in detail
-        if message_count <= 10:
-            print(f"    └─ Source: {source_column}")
-            print(f"    └─ Transform: scale={transform['scale']}, offset={transform['offset']}")
-            print()
-    
-    print("...")
-    print(f"    ... and {len(config['channels']) - 10} more messages")
-    print()
+    # Transform parameters as arrays
+    scales = np.array(scale_list, dtype=np.float64)
+    offsets = np.array(offset_list, dtype=np.float64)
+    src_idx = np.arange(len(channels)) % len(sample_data)
+    
+    # Simulate getting values from data and apply transform in one vectorized step
+    transformed_values = scales * sample_data[src_idx] + offsets
+    frame_values = list(zip(addresses, transformed_values))
+    
+    # Simulate sending messages: format every line in one pass over the computed values
+    message_lines = [f"{n:2d}. {address:25s} = {value:8.3f}°"
+                     for n, (address, value) in enumerate(frame_values, 1)]
+    
+    # Show first 10 messages in detail
+    for line, (_, source_column, scale, offset) in zip(message_lines[:10], channels):
+        out += [line,
+                f"    └─ Source: {source_column}",
+                f"    └─ Transform: scale={scale}, offset={offset}",
+                ""]
+    out += message_lines[10:]
+    
+    out.append("...")
+    out.append(f"    ... and {len(channels) - 10} more messages")
+    out.append("")
     
     # Show control messages
-    print("🎮 Control Messages:")
-    print(f"    /mh/frame = {frame_count}")
-    print(f"    /mh/mode = \"{mode}\"")
-    print()
-    
-    print("📊 Message Statistics:")
-    print(f"    Total messages per frame: {len(config['channels']) + 2}")
-    print(f"    Messages per second: {(len(config['channels']) + 2) * 60}")
-    print(f"    Protocol: UDP/OSC")
-    print(f"    Network: Local (127.0.0.1:7000)")
-    print()
-    
-    print("🦴 Bone Distribution:")
-    print("-" * 20)
-    bone_counts = {}
-    for channel in config['channels']:
-        bone = channel['osc_address'].split('/')[2]
-        if bone not in bone_counts:
-            bone_counts[bone] = 0
-        bone_counts[bone] += 1
+    out.append("🎮 Control Messages:")
+    out.append(f"    /mh/frame = {frame_count}")
+    out.append(f"    /mh/mode = \"{mode}\"")
+    out.append("")
+    
+    # The frame as it goes on the wire: channel values and control messages in one bundle
+    bundle = build_frame_bundle([(address, float(value)) for address, value in frame_values]
+                                + [("/mh/frame", frame_count), ("/mh/mode", mode)])
+    out.append("📦 On the Wire (one OSC bundle per frame):")
+    out.append(f"    {len(frame_values) + 2} messages -> 1 datagram, {bundle.size} bytes")
+    out.append("")
+    
+    out.append("📊 Message Statistics:")
+    out.append(f"    Total messages per frame: {len(channels) + 2}")
+    out.append(f"    Messages per second: {(len(channels) + 2) * 60}")
+    out.append(f"    Protocol: UDP/OSC")
+    out.append("    Datagrams per frame: 1 (OSC bundle)")
+    out.append(f"    Network: Local (127.0.0.1:7000)")
+    out.append("")
+    
+    out.append("🦴 Bone Distribution:")
+    out.append("-" * 20)
+    bone_counts = Counter(address.split('/', 3)[2] for address in addresses)
     
     for bone, count in sorted(bone_counts.items()):
-        print(f"    {bone:15s}: {count:2d} messages")
-    print()
-    
-    print("🎯 Key Points:")
-    print("    ✅ Each bone axis gets its own OSC message")
-    print("    ✅ 37 individual messages per frame (not 1 big message)")
-    print("    ✅ Messages sent 60 times per second")
-    print("    ✅ Unreal Engine receives and processes each message individually")
-    print("    ✅ This creates smooth, real-time animation")
+        out.append(f"    {bone:15s}: {count:2d} messages")
+    out.append("")
+    
+    out.append("🎯 Key Points:")
+    out.append("    ✅ Each bone axis gets its own OSC message")
+    out.append("    ✅ 37 channel messages per frame, delivered together in one OSC bundle")
+    out.append("    ✅ Frames sent 60 times per second")
+    out.append("    ✅ Unreal Engine unpacks the bundle and processes each message individually")
+    out.append("    ✅ This creates smooth, real-time animation")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     demonstrate_message_structure()
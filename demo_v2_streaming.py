@@ -5,26 +5,55 @@ Shows the exact OSC messages and data flow
 """
 
 import json
+import sys
+import struct
 import numpy as np
+from pythonosc import osc_message_builder
+
+def build_mode_frame(channel_values, mode):
+    """Prebuild a mode's whole OSC frame bundle once
+    
+    Returns the bundle bytes and the offset of the /mh/frame counter, so
+    each tick only patches four bytes before sending.
+    """
+    def element(address, value):
+        msg = osc_message_builder.OscMessageBuilder(address=address)
+        msg.add_arg(value)
+        dgram = msg.build().dgram
+        return struct.pack(">i", len(dgram)) + dgram
+    
+    frame = bytearray(b"#bundle\0" + struct.pack(">Q", 1))  # timetag 1 = immediately
+    for address, value in channel_values.items():
+        frame += element(address, float(value))
+    frame += element("/mh/frame", 0)
+    frame_offset = len(frame) - 4
+    frame += element("/mh/mode", mode)
+    return frame, frame_offset
+
+def patch_frame(frame, frame_offset, frame_id):
+    """Write the frame counter into a prebuilt frame in place"""
+    struct.pack_into(">i", frame, frame_offset, frame_id)
 
 def demo_v2_streaming():
     """Demonstrate what the v2 streamer sends to Unreal"""
+    # Collect the report and write it to stdout in one go
+    out = []
     
-    print("🎭 MetaHuman Streamer v2 - What's Streaming to Unreal")
-    print("=" * 60)
+    out.append("🎭 MetaHuman Streamer v2 - What's Streaming to Unreal")
+    out.append("=" * 60)
     
     # Simulate the v2 streamer configuration
-    print("1. STREAMER CONFIGURATION:")
-    print("-" * 30)
-    print("• OSC Endpoint: 127.0.0.1:7000")
-    print("• Streaming Rate: 30 FPS")
-    print("• Data Source: ML Models (GRU)")
-    print("• Modes: BASELINE, TURNING_LEFT, TURNING_RIGHT")
-    print()
+    out.append("1. STREAMER CONFIGURATION:")
+    out.append("-" * 30)
+    out.append("• OSC Endpoint: 127.0.0.1:7000")
+    out.append("• Streaming Rate: 30 FPS")
+    out.append("• Data Source: ML Models (GRU)")
+    out.append("• Modes: BASELINE, TURNING_LEFT, TURNING_RIGHT")
+    out.append("")
     
     # Show what channels would be configured
-    print("2. OSC CHANNELS (Bone-level messages):")
-    print("-" * 40)
+    out.append("2. OSC CHANNELS (Bone-level messages):")
+    out.append("-" * 40)
     
     # Simulate typical MetaHuman bone channels
     bone_channels = [
@@ -51,31 +80,35 @@ def demo_v2_streaming():
     ]
     
     for i, channel in enumerate(bone_channels):
-        print(f"  {i+1:2d}. {channel}")
-    print(f"     ... and more (typically 37+ channels)")
-    print()
+        out.append(f"  {i+1:2d}. {channel}")
+    out.append(f"     ... and more (typically 37+ channels)")
+    out.append("")
     
     # Show data flow
-    print("3. DATA FLOW:")
-    print("-" * 15)
-    print("Raw Data → ML Model → Denormalize → Transform → OSC")
-    print("   ↓           ↓           ↓           ↓        ↓")
-    print("864 features → GRU → Real values → Scale/Offset → Unreal")
-    print()
+    out.append("3. DATA FLOW:")
+    out.append("-" * 15)
+    out.append("Raw Data → ML Model → Denormalize → Transform → OSC")
+    out.append("   ↓           ↓           ↓           ↓        ↓")
+    out.append("864 features → GRU → Real values → Scale/Offset → Unreal")
+    out.append("")
     
     # Show what happens during streaming
-    print("4. STREAMING PROCESS:")
-    print("-" * 25)
-    print("• Continuously streams at 30 FPS")
-    print("• Each frame sends 37+ individual OSC messages")
-    print("• Messages contain bone rotation values in degrees")
-    print("• Values are transformed and clamped")
-    print("• Control messages sent for frame tracking")
-    print()
+    out.append("4. STREAMING PROCESS:")
+    out.append("-" * 25)
+    out.append("• Continuously streams at 30 FPS")
+    out.append("• Each frame's 37+ OSC messages go out together as an OSC bundle")
+    out.append("• One datagram per frame, split into more bundles only past 1400 bytes")
+    out.append("• Messages contain bone rotation values in degrees")
+    out.append("• Values are transformed and clamped")
+    out.append("• Control messages sent for frame tracking")
+    out.append("")
     
     # Show sample data
-    print("5. SAMPLE OSC MESSAGES (Frame 1):")
-    print("-" * 40)
+    out.append("5. SAMPLE OSC MESSAGES (Frame 1):")
+    out.append("-" * 40)
+    
+    # Per-mode frames are prebuilt once; streaming only patches the frame counter
+    frame_bytes = {}
     
     # Simulate baseline values
     baseline_values = {
@@ -92,14 +125,17 @@ def demo_v2_streaming():
     }
     
     for channel, value in baseline_values.items():
-        print(f"  {channel:35s} = {value:8.3f}")
-    print("  /mh/frame                           = 1")
-    print("  /mh/mode                            = BASELINE")
-    print()
+        out.append(f"  {channel:35s} = {value:8.3f}")
+    out.append("  /mh/frame                           = 1")
+    out.append("  /mh/mode                            = BASELINE")
+    frame_bytes["BASELINE"], frame_offset = build_mode_frame(baseline_values, "BASELINE")
+    patch_frame(frame_bytes["BASELINE"], frame_offset, 1)
+    out.append(f"  (prebuilt bundle: {len(frame_bytes['BASELINE'])} bytes, frame counter at byte {frame_offset})")
+    out.append("")
     
     # Show turn left example
-    print("6. SAMPLE OSC MESSAGES (Turn Left):")
-    print("-" * 40)
+    out.append("6. SAMPLE OSC MESSAGES (Turn Left):")
+    out.append("-" * 40)
     
     # Simulate left turn values
     left_turn_values = {
@@ -116,14 +152,17 @@ def demo_v2_streaming():
     }
     
     for channel, value in left_turn_values.items():
-        print(f"  {channel:35s} = {value:8.3f}")
-    print("  /mh/frame                           = 2")
-    print("  /mh/mode                            = TURNING_LEFT")
-    print()
+        out.append(f"  {channel:35s} = {value:8.3f}")
+    out.append("  /mh/frame                           = 2")
+    out.append("  /mh/mode                            = TURNING_LEFT")
+    frame_bytes["TURNING_LEFT"], frame_offset = build_mode_frame(left_turn_values, "TURNING_LEFT")
+    patch_frame(frame_bytes["TURNING_LEFT"], frame_offset, 2)
+    out.append(f"  (prebuilt bundle: {len(frame_bytes['TURNING_LEFT'])} bytes, frame counter at byte {frame_offset})")
+    out.append("")
     
     # Show turn right example
-    print("7. SAMPLE OSC MESSAGES (Turn Right):")
-    print("-" * 40)
+    out.append("7. SAMPLE OSC MESSAGES (Turn Right):")
+    out.append("-" * 40)
     
     # Simulate right turn values
     right_turn_values = {
@@ -140,39 +179,44 @@ def demo_v2_streaming():
     }
     
     for channel, value in right_turn_values.items():
-        print(f"  {channel:35s} = {value:8.3f}")
-    print("  /mh/frame                           = 3")
-    print("  /mh/mode                            = TURNING_RIGHT")
-    print()
+        out.append(f"  {channel:35s} = {value:8.3f}")
+    out.append("  /mh/frame                           = 3")
+    out.append("  /mh/mode                            = TURNING_RIGHT")
+    frame_bytes["TURNING_RIGHT"], frame_offset = build_mode_frame(right_turn_values, "TURNING_RIGHT")
+    patch_frame(frame_bytes["TURNING_RIGHT"], frame_offset, 3)
+    out.append(f"  (prebuilt bundle: {len(frame_bytes['TURNING_RIGHT'])} bytes, frame counter at byte {frame_offset})")
+    out.append("")
     
     # Show data processing
-    print("8. DATA PROCESSING:")
-    print("-" * 20)
-    print("• Raw ML output: 864 features (normalized)")
-    print("• Denormalization: (value * std) + mean")
-    print("• Transformation: (value * scale) + offset")
-    print("• Clamping: min/max limits applied")
-    print("• Units: Degrees for rotations")
-    print()
+    out.append("8. DATA PROCESSING:")
+    out.append("-" * 20)
+    out.append("• Raw ML output: 864 features (normalized)")
+    out.append("• Denormalization: (value * std) + mean")
+    out.append("• Transformation: (value * scale) + offset")
+    out.append("• Clamping: min/max limits applied")
+    out.append("• Units: Degrees for rotations")
+    out.append("")
     
     # Show streaming modes
-    print("9. STREAMING MODES:")
-    print("-" * 20)
-    print("• BASELINE: Default sitting position")
-    print("• TURNING_LEFT: Left steering movement")
-    print("• TURNING_RIGHT: Right steering movement")
-    print("• Smooth transitions between modes")
-    print("• Auto-return to baseline after turns")
-    print()
-    
-    print("=" * 60)
-    print("🎯 SUMMARY:")
-    print("• v2 sends MANY individual /bone/{bone}/{axis} messages")
-    print("• Each message contains a single rotation value")
-    print("• Values are in degrees and represent bone rotations")
-    print("• 30 FPS continuous streaming")
-    print("• ML models generate realistic movement sequences")
-    print("• Perfect for detailed MetaHuman animation control")
+    out.append("9. STREAMING MODES:")
+    out.append("-" * 20)
+    out.append("• BASELINE: Default sitting position")
+    out.append("• TURNING_LEFT: Left steering movement")
+    out.append("• TURNING_RIGHT: Right steering movement")
+    out.append("• Smooth transitions between modes")
+    out.append("• Auto-return to baseline after turns")
+    out.append("")
+    
+    out.append("=" * 60)
+    out.append("🎯 SUMMARY:")
+    out.append("• v2 sends one /bone/{bone}/{axis} message per channel, bundled per frame")
+    out.append("• Each message contains a single rotation value")
+    out.append("• Values are in degrees and represent bone rotations")
+    out.append("• 30 FPS continuous streaming")
+    out.append("• ML models generate realistic movement sequences")
+    out.append("• Perfect for detailed MetaHuman animation control")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     demo_v2_streaming()
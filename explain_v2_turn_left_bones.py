@@ -4,21 +4,26 @@ Explanation: What bones are targeted when clicking "Turn Left" in v2 streamer
 Shows the exact OSC messages and bone movements for steering wheel turns
 """
 
+import os
+import sys
+
 def explain_turn_left_bones():
     """Explain which bones are targeted for left turn movements"""
+    # Collect the report and emit it with one write() of UTF-8 bytes
+    out = []
     
-    print("🎯 MetaHuman Streamer v2 - Turn Left Bone Targeting")
-    print("=" * 60)
+    out.append("🎯 MetaHuman Streamer v2 - Turn Left Bone Targeting")
+    out.append("=" * 60)
     
-    print("\n🔄 WHEN YOU CLICK 'TURN LEFT':")
-    print("-" * 40)
-    print("The streamer switches from BASELINE mode to TURNING_LEFT mode")
-    print("It loads the left turn ML model and generates a 60-frame sequence")
-    print("Each frame contains data for ALL 37 bone channels simultaneously")
-    print("The streamer sends 37 individual OSC messages per frame at 30 FPS")
+    out.append("\n🔄 WHEN YOU CLICK 'TURN LEFT':")
+    out.append("-" * 40)
+    out.append("The streamer switches from BASELINE mode to TURNING_LEFT mode")
+    out.append("It loads the left turn ML model and generates a 60-frame sequence")
+    out.append("Each frame contains data for ALL 37 bone channels simultaneously")
+    out.append("The streamer sends the 37 channel messages as one OSC bundle per frame at 30 FPS")
     
-    print("\n🦴 TARGETED BONES (37 total channels):")
-    print("-" * 45)
+    out.append("\n🦴 TARGETED BONES (37 total channels):")
+    out.append("-" * 45)
     
     # Group bones by body region
     bone_groups = {
@@ -81,51 +86,55 @@ def explain_turn_left_bones():
     }
     
     for group_name, bones in bone_groups.items():
-        print(f"\n{group_name}:")
+        out.append(f"\n{group_name}:")
         for bone in bones:
             if bone:  # Skip empty strings
-                print(f"  {bone}")
+                out.append(f"  {bone}")
+    
+    out.append("\n🎯 KEY POINTS FOR TURN LEFT:")
+    out.append("-" * 35)
+    out.append("• ALL 37 bones receive data simultaneously")
+    out.append("• Each bone gets 3 values: pitch, roll, yaw (except pelvis which has all 3)")
+    out.append("• Spine movements are distributed across 5 spine bones with different weights")
+    out.append("• The ML model generates realistic steering wheel turning motions")
+    out.append("• Data flows: ML Model → Denormalization → OSC Transform → Unreal Engine")
     
-    print("\n🎯 KEY POINTS FOR TURN LEFT:")
-    print("-" * 35)
-    print("• ALL 37 bones receive data simultaneously")
-    print("• Each bone gets 3 values: pitch, roll, yaw (except pelvis which has all 3)")
-    print("• Spine movements are distributed across 5 spine bones with different weights")
-    print("• The ML model generates realistic steering wheel turning motions")
-    print("• Data flows: ML Model → Denormalization → OSC Transform → Unreal Engine")
+    out.append("\n📊 DATA FLOW:")
+    out.append("-" * 15)
+    out.append("1. Click 'Turn Left' → Load left_turn_model")
+    out.append("2. Generate 60-frame sequence (2 seconds at 30 FPS)")
+    out.append("3. For each frame:")
+    out.append("   - Denormalize data using baseline mean/std")
+    out.append("   - Apply OSC transforms (scale, offset, clamp)")
+    out.append("   - Send the 37 OSC messages together in one bundle")
+    out.append("   - Each message: /bone/{bone}/{axis} → float(degrees)")
     
-    print("\n📊 DATA FLOW:")
-    print("-" * 15)
-    print("1. Click 'Turn Left' → Load left_turn_model")
-    print("2. Generate 60-frame sequence (2 seconds at 30 FPS)")
-    print("3. For each frame:")
-    print("   - Denormalize data using baseline mean/std")
-    print("   - Apply OSC transforms (scale, offset, clamp)")
-    print("   - Send 37 individual OSC messages")
-    print("   - Each message: /bone/{bone}/{axis} → float(degrees)")
+    out.append("\n🔄 CONTINUOUS STREAMING:")
+    out.append("-" * 25)
+    out.append("• Streamer loops through the 60-frame sequence")
+    out.append("• When sequence ends, it repeats from frame 0")
+    out.append("• Click 'Return to Baseline' to stop turn and resume baseline")
+    out.append("• Click 'Turn Right' to switch to right turn model")
     
-    print("\n🔄 CONTINUOUS STREAMING:")
-    print("-" * 25)
-    print("• Streamer loops through the 60-frame sequence")
-    print("• When sequence ends, it repeats from frame 0")
-    print("• Click 'Return to Baseline' to stop turn and resume baseline")
-    print("• Click 'Turn Right' to switch to right turn model")
+    out.append("\n💡 WHY THESE BONES?")
+    out.append("-" * 20)
+    out.append("• PELVIS: Core body rotation for steering")
+    out.append("• SPINE: Realistic torso twisting motion")
+    out.append("• NECK: Head movement following body")
+    out.append("• SHOULDERS: Arm positioning for steering wheel")
+    out.append("• FOREARMS: Elbow and arm extension")
+    out.append("• HANDS: Wrist and hand positioning on wheel")
     
-    print("\n💡 WHY THESE BONES?")
-    print("-" * 20)
-    print("• PELVIS: Core body rotation for steering")
-    print("• SPINE: Realistic torso twisting motion")
-    print("• NECK: Head movement following body")
-    print("• SHOULDERS: Arm positioning for steering wheel")
-    print("• FOREARMS: Elbow and arm extension")
-    print("• HANDS: Wrist and hand positioning on wheel")
+    out.append("\n🎮 UNREAL ENGINE RECEPTION:")
+    out.append("-" * 30)
+    out.append("• Unreal receives 37 OSC messages per frame")
+    out.append("• Each message updates one bone axis")
+    out.append("• MetaHuman skeleton animates in real-time")
+    out.append("• Smooth 30 FPS animation with realistic steering motion")
     
-    print("\n🎮 UNREAL ENGINE RECEPTION:")
-    print("-" * 30)
-    print("• Unreal receives 37 OSC messages per frame")
-    print("• Each message updates one bone axis")
-    print("• MetaHuman skeleton animates in real-time")
-    print("• Smooth 30 FPS animation with realistic steering motion")
+    payload = memoryview(("\n".join(out) + "\n").encode("utf-8"))
+    while payload:
+        payload = payload[os.write(sys.stdout.fileno(), payload):]
 
 if __name__ == "__main__":
     explain_turn_left_bones()
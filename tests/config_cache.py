@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Load the config and data files shared by the test and demo scripts, reading each only once
+"""
+
+import functools
+import os
+
+import numpy as np
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; the stdlib parser gives the same result
+    import json as _json
+
+NORM_PARAMS_PATH = "data/processed_v2/normalization_params.json"
+
+@functools.lru_cache(maxsize=None)
+def _load_json(abs_path):
+    with open(abs_path, 'rb') as f:
+        return _json.loads(f.read())
+
+def load_config(path):
+    """Parsed contents of a JSON file, cached per absolute path (treat as read-only)"""
+    return _load_json(os.path.abspath(path))
+
+def load_norm_params():
+    """Normalization parameters (feature_columns, mean, std, target_frames)"""
+    return load_config(NORM_PARAMS_PATH)
+
+@functools.lru_cache(maxsize=None)
+def load_norm_arrays():
+    """(mean, std) from the normalization parameters as read-only ndarrays, built once"""
+    norm_params = load_norm_params()
+    mean = np.asarray(norm_params['mean'])
+    std = np.asarray(norm_params['std'])
+    mean.setflags(write=False)
+    std.setflags(write=False)
+    return mean, std
+
+@functools.lru_cache(maxsize=None)
+def _load_array(abs_path):
+    return np.load(abs_path, mmap_mode='r')
+
+def load_array(path):
+    """Read-only memory map of a .npy file, opened once per absolute path"""
+    return _load_array(os.path.abspath(path))
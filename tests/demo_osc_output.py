@@ -5,18 +5,19 @@ This script will capture and display the OSC messages being sent
 """
 
 import numpy as np
-import json
-import time
-from pythonosc import dispatcher, osc_server
+from collections import Counter
 import threading
 import sys
 import os
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from osc_receiver import MessageCapture, start_mh_server
+from feature_categories import feature_category, body_part
+from config_cache import load_norm_params
 
 # Global variables to store received messages
-received_messages = []
+received_messages = MessageCapture()
 message_count = 0
 
 def handle_mh_message(address, *args):
@@ -25,24 +26,14 @@ def handle_mh_message(address, *args):
     message_count += 1
     
     # Store the message
-    received_messages.append({
-        'address': address,
-        'args': args,
-        'timestamp': time.time()
-    })
+    received_messages.append(address, args)
     
     # Print the message
     print(f"[{message_count:03d}] {address}: {args}")
 
 def start_osc_server(host="127.0.0.1", port=7000):
     """Start OSC server to receive messages"""
-    disp = dispatcher.Dispatcher()
-    
-    # Register handler for all MetaHuman messages
-    disp.map("/mh/*", handle_mh_message)
-    
-    server = osc_server.ThreadingOSCServer((host, port), disp)
-    print(f"OSC Server started on {host}:{port}")
+    server = start_mh_server(handle_mh_message, host, port)
     print("Waiting for MetaHuman Streamer v2 messages...")
     print("=" * 60)
     
@@ -54,116 +45,109 @@ def analyze_messages():
         print("No messages received yet.")
         return
     
-    print("\n" + "=" * 60)
-    print("MESSAGE ANALYSIS")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("MESSAGE ANALYSIS")
+    out.append("=" * 60)
+    
+    addresses, args, _ = received_messages.snapshot()
     
     # Group messages by address
-    address_counts = {}
-    for msg in received_messages:
-        addr = msg['address']
-        address_counts[addr] = address_counts.get(addr, 0) + 1
+    address_counts = Counter(addresses)
     
-    print(f"Total messages received: {len(received_messages)}")
-    print(f"Unique addresses: {len(address_counts)}")
-    print("\nMessage frequency by address:")
+    out.append(f"Total messages received: {received_messages.count}")
+    if received_messages.count > len(addresses):
+        out.append(f"Analyzing the most recent {len(addresses)} messages")
+    out.append(f"Unique addresses: {len(address_counts)}")
+    out.append("\nMessage frequency by address:")
     
-    # Sort by frequency
-    sorted_addresses = sorted(address_counts.items(), key=lambda x: x[1], reverse=True)
-    for addr, count in sorted_addresses[:10]:  # Show top 10
-        print(f"  {addr}: {count} messages")
+    # Top 10 by frequency (partial heap selection; ties keep arrival order like a stable sort)
+    for addr, count in address_counts.most_common(10):
+        out.append(f"  {addr}: {count} messages")
     
-    if len(sorted_addresses) > 10:
-        print(f"  ... and {len(sorted_addresses) - 10} more addresses")
+    if len(address_counts) > 10:
+        out.append(f"  ... and {len(address_counts) - 10} more addresses")
     
     # Show sample data for different types of messages
-    print("\nSample data types:")
+    out.append("\nSample data types:")
+    
+    # Classify each unique address once, then test messages by set membership
+    position_addrs = {addr for addr in address_counts if 'position' in addr}
+    rotation_addrs = {addr for addr in address_counts
+                      if any(rot in addr for rot in ['flexion', 'rotation', 'tilt'])}
+    
+    latest_first = range(len(addresses) - 1, -1, -1)
     
     # Find position messages
-    position_msgs = [msg for msg in received_messages if 'position' in msg['address']]
-    if position_msgs:
-        print(f"\nPosition data example ({position_msgs[0]['address']}):")
-        print(f"  Value: {position_msgs[0]['args'][0]}")
+    position_idx = next((i for i, addr in enumerate(addresses) if addr in position_addrs), None)
+    if position_idx is not None:
+        out.append(f"\nPosition data example ({addresses[position_idx]}):")
+        out.append(f"  Value: {args[position_idx][0]}")
     
     # Find rotation messages
-    rotation_msgs = [msg for msg in received_messages if any(rot in msg['address'] for rot in ['flexion', 'rotation', 'tilt'])]
-    if rotation_msgs:
-        print(f"\nRotation data example ({rotation_msgs[0]['address']}):")
-        print(f"  Value: {rotation_msgs[0]['args'][0]}")
-    
-    # Find frame info
-    frame_msgs = [msg for msg in received_messages if msg['address'] == '/mh/frame']
-    if frame_msgs:
-        print(f"\nFrame info:")
-        print(f"  Current frame: {frame_msgs[-1]['args'][0]}")
-    
-    mode_msgs = [msg for msg in received_messages if msg['address'] == '/mh/mode']
-    if mode_msgs:
-        print(f"  Current mode: {mode_msgs[-1]['args'][0]}")
+    rotation_idx = next((i for i, addr in enumerate(addresses) if addr in rotation_addrs), None)
+    if rotation_idx is not None:
+        out.append(f"\nRotation data example ({addresses[rotation_idx]}):")
+        out.append(f"  Value: {args[rotation_idx][0]}")
+    
+    # Find frame info (latest first)
+    frame_idx = next((i for i in latest_first if addresses[i] == '/mh/frame'), None)
+    if frame_idx is not None:
+        out.append(f"\nFrame info:")
+        out.append(f"  Current frame: {args[frame_idx][0]}")
+    
+    mode_idx = next((i for i in latest_first if addresses[i] == '/mh/mode'), None)
+    if mode_idx is not None:
+        out.append(f"  Current mode: {args[mode_idx][0]}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def show_data_structure():
     """Show the structure of data being sent"""
-    print("\n" + "=" * 60)
-    print("DATA STRUCTURE OVERVIEW")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("DATA STRUCTURE OVERVIEW")
+    out.append("=" * 60)
     
     try:
         # Load normalization parameters to understand the data
-        with open("data/processed_v2/normalization_params.json", 'r') as f:
-            norm_params = json.load(f)
+        norm_params = load_norm_params()
         
         feature_columns = norm_params['feature_columns']
         
-        print(f"Total features being streamed: {len(feature_columns)}")
-        print(f"Target frames per sequence: {norm_params['target_frames']}")
+        out.append(f"Total features being streamed: {len(feature_columns)}")
+        out.append(f"Target frames per sequence: {norm_params['target_frames']}")
         
-        print("\nFeature categories:")
+        out.append("\nFeature categories:")
         categories = {}
         for col in feature_columns:
             # Extract category from column name
-            if 'position' in col:
-                category = 'Position'
-            elif 'velocity' in col:
-                category = 'Velocity'
-            elif 'acceleration' in col:
-                category = 'Acceleration'
-            elif any(rot in col for rot in ['flexion', 'rotation', 'tilt']):
-                category = 'Rotation'
-            else:
-                category = 'Other'
-            
+            category = feature_category(col)
             categories[category] = categories.get(category, 0) + 1
         
         for cat, count in categories.items():
-            print(f"  {cat}: {count} features")
+            out.append(f"  {cat}: {count} features")
         
-        print("\nBody parts being tracked:")
+        out.append("\nBody parts being tracked:")
         body_parts = set()
         for col in feature_columns:
-            if 'Pelvis' in col:
-                body_parts.add('Pelvis')
-            elif 'Chest' in col or 'Thorax' in col:
-                body_parts.add('Chest/Thorax')
-            elif 'Head' in col or 'Neck' in col:
-                body_parts.add('Head/Neck')
-            elif 'Shoulder' in col or 'Scapula' in col or 'UpperArm' in col:
-                body_parts.add('Shoulder/Arm')
-            elif 'ForeArm' in col or 'Wrist' in col or 'Hand' in col:
-                body_parts.add('Forearm/Hand')
-            elif 'Digit' in col:
-                body_parts.add('Fingers')
+            part = body_part(col)
+            if part:
+                body_parts.add(part)
         
         for part in sorted(body_parts):
-            print(f"  {part}")
+            out.append(f"  {part}")
         
-        print(f"\nSample feature names:")
+        out.append(f"\nSample feature names:")
         for i, col in enumerate(feature_columns[:10]):
-            print(f"  {i+1:2d}. {col}")
+            out.append(f"  {i+1:2d}. {col}")
         if len(feature_columns) > 10:
-            print(f"  ... and {len(feature_columns) - 10} more features")
+            out.append(f"  ... and {len(feature_columns) - 10} more features")
             
     except Exception as e:
-        print(f"Could not load feature information: {e}")
+        out.append(f"Could not load feature information: {e}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main function to demonstrate OSC output"""
@@ -4,122 +4,126 @@ Example of OSC messages sent by MetaHuman Streamer v2
 """
 
 import numpy as np
-import json
+import sys
+from feature_categories import ROTATION_RE
+from config_cache import load_norm_params
 
 def show_osc_message_examples():
     """Show examples of OSC messages that the streamer sends"""
-    print("MetaHuman Streamer v2 - OSC Message Examples")
-    print("=" * 60)
+    out = []
+    out.append("MetaHuman Streamer v2 - OSC Message Examples")
+    out.append("=" * 60)
     
     try:
-        # Load sample data
-        baseline_data = np.load("data/processed_v2/baseline_data.npy")
-        sample_frame = baseline_data[0, 0, :]  # First frame
+        # Load sample data (memory-mapped: only the first frame is read from disk)
+        baseline_data = np.load("data/processed_v2/baseline_data.npy", mmap_mode='r')
+        sample_frame = np.array(baseline_data[0, 0, :])  # First frame
         
         # Load feature names
-        with open("data/processed_v2/normalization_params.json", 'r') as f:
-            norm_params = json.load(f)
+        norm_params = load_norm_params()
         feature_columns = norm_params['feature_columns']
         
-        print("📡 ACTUAL OSC MESSAGES SENT BY THE STREAMER")
-        print("=" * 60)
-        print()
+        out.append("📡 ACTUAL OSC MESSAGES SENT BY THE STREAMER")
+        out.append("=" * 60)
+        out.append("")
         
         # Show first 20 features as they would appear in OSC
-        print("BONE POSITION DATA:")
+        out.append("BONE POSITION DATA:")
         for i in range(20):
             if i < len(feature_columns) and i < len(sample_frame):
                 address = f"/mh/{feature_columns[i]}"
                 value = sample_frame[i]
-                print(f"  {address} -> {value:.6f}")
-        print()
+                out.append(f"  {address} -> {value:.6f}")
+        out.append("")
         
         # Show control messages
-        print("CONTROL MESSAGES:")
-        print("  /mh/frame -> 0")
-        print("  /mh/mode -> BASELINE")
-        print()
+        out.append("CONTROL MESSAGES:")
+        out.append("  /mh/frame -> 0")
+        out.append("  /mh/mode -> BASELINE")
+        out.append("")
         
         # Show different types of data
-        print("DATA TYPES BY CATEGORY:")
-        print()
+        out.append("DATA TYPES BY CATEGORY:")
+        out.append("")
         
         # Position data
         position_features = [i for i, col in enumerate(feature_columns) if 'position' in col][:5]
-        print("📍 POSITION DATA (x, y, z coordinates):")
+        out.append("📍 POSITION DATA (x, y, z coordinates):")
         for i in position_features:
             address = f"/mh/{feature_columns[i]}"
             value = sample_frame[i]
-            print(f"  {address} -> {value:.6f}")
-        print()
+            out.append(f"  {address} -> {value:.6f}")
+        out.append("")
         
         # Rotation data
-        rotation_features = [i for i, col in enumerate(feature_columns) if any(rot in col for rot in ['flexion', 'rotation', 'tilt'])][:5]
-        print("🔄 ROTATION DATA (joint angles):")
+        rotation_features = [i for i, col in enumerate(feature_columns) if ROTATION_RE.search(col)][:5]
+        out.append("🔄 ROTATION DATA (joint angles):")
         for i in rotation_features:
             address = f"/mh/{feature_columns[i]}"
             value = sample_frame[i]
-            print(f"  {address} -> {value:.6f}")
-        print()
+            out.append(f"  {address} -> {value:.6f}")
+        out.append("")
         
         # Velocity data
         velocity_features = [i for i, col in enumerate(feature_columns) if 'velocity' in col][:5]
-        print("⚡ VELOCITY DATA (movement speed):")
+        out.append("⚡ VELOCITY DATA (movement speed):")
         for i in velocity_features:
             address = f"/mh/{feature_columns[i]}"
             value = sample_frame[i]
-            print(f"  {address} -> {value:.6f}")
-        print()
+            out.append(f"  {address} -> {value:.6f}")
+        out.append("")
         
         # Show what happens during different modes
-        print("🎭 DIFFERENT MOVEMENT MODES:")
-        print()
-        print("BASELINE MODE:")
-        print("  /mh/mode -> BASELINE")
-        print("  (All 864 features stream baseline sitting position)")
-        print()
-        print("TURNING LEFT MODE:")
-        print("  /mh/mode -> TURNING_LEFT")
-        print("  (Bones involved in left turn animate, others stay baseline)")
-        print()
-        print("TURNING RIGHT MODE:")
-        print("  /mh/mode -> TURNING_RIGHT")
-        print("  (Bones involved in right turn animate, others stay baseline)")
-        print()
+        out.append("🎭 DIFFERENT MOVEMENT MODES:")
+        out.append("")
+        out.append("BASELINE MODE:")
+        out.append("  /mh/mode -> BASELINE")
+        out.append("  (All 864 features stream baseline sitting position)")
+        out.append("")
+        out.append("TURNING LEFT MODE:")
+        out.append("  /mh/mode -> TURNING_LEFT")
+        out.append("  (Bones involved in left turn animate, others stay baseline)")
+        out.append("")
+        out.append("TURNING RIGHT MODE:")
+        out.append("  /mh/mode -> TURNING_RIGHT")
+        out.append("  (Bones involved in right turn animate, others stay baseline)")
+        out.append("")
         
         # Show frame progression
-        print("⏱️  FRAME PROGRESSION (at 30 FPS):")
-        print("  Frame 0:  /mh/frame -> 0")
-        print("  Frame 1:  /mh/frame -> 1")
-        print("  Frame 2:  /mh/frame -> 2")
-        print("  ...")
-        print("  Frame 59: /mh/frame -> 59")
-        print("  (Then loops back to frame 0)")
-        print()
+        out.append("⏱️  FRAME PROGRESSION (at 30 FPS):")
+        out.append("  Frame 0:  /mh/frame -> 0")
+        out.append("  Frame 1:  /mh/frame -> 1")
+        out.append("  Frame 2:  /mh/frame -> 2")
+        out.append("  ...")
+        out.append("  Frame 59: /mh/frame -> 59")
+        out.append("  (Then loops back to frame 0)")
+        out.append("")
         
         # Show data rate
-        print("📊 DATA RATE:")
-        print(f"  Features per frame: {len(feature_columns)}")
-        print("  Control messages per frame: 2")
-        print("  Total messages per frame: 866")
-        print("  At 30 FPS: 25,980 messages/second")
-        print("  At 60 FPS: 51,960 messages/second")
-        print()
+        out.append("📊 DATA RATE:")
+        out.append(f"  Features per frame: {len(feature_columns)}")
+        out.append("  Control messages per frame: 2")
+        out.append("  Total messages per frame: 866")
+        out.append("  At 30 FPS: 25,980 messages/second")
+        out.append("  At 60 FPS: 51,960 messages/second")
+        out.append("")
         
         # Show what Unreal Engine would do with this data
-        print("🎯 UNREAL ENGINE INTEGRATION:")
-        print("  1. Listen for OSC messages on configured port")
-        print("  2. Map addresses to bone transforms:")
-        print("     /mh/Pelvis_position_x -> Pelvis bone X position")
-        print("     /mh/LeftShoulder_flexion -> Left shoulder rotation")
-        print("     /mh/Head_position_y -> Head bone Y position")
-        print("  3. Apply denormalization if needed")
-        print("  4. Update bone transforms in real-time")
-        print("  5. Use /mh/mode for animation blending")
-        print("  6. Use /mh/frame for timing synchronization")
+        out.append("🎯 UNREAL ENGINE INTEGRATION:")
+        out.append("  1. Listen for OSC messages on configured port")
+        out.append("  2. Map addresses to bone transforms:")
+        out.append("     /mh/Pelvis_position_x -> Pelvis bone X position")
+        out.append("     /mh/LeftShoulder_flexion -> Left shoulder rotation")
+        out.append("     /mh/Head_position_y -> Head bone Y position")
+        out.append("  3. Apply denormalization if needed")
+        out.append("  4. Update bone transforms in real-time")
+        out.append("  5. Use /mh/mode for animation blending")
+        out.append("  6. Use /mh/frame for timing synchronization")
         
     except Exception as e:
-        print(f"Error: {e}")
+        out.append(f"Error: {e}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     show_osc_message_examples()
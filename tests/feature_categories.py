@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Classify MetaHuman feature column names by data type and body part
+"""
+
+import functools
+import re
+
+# Each alternative is a lookahead tried in order from the start of the name, so the
+# first listed category wins, like the if/elif ladders this replaces
+CATEGORY_RE = re.compile(
+    r'^(?:(?=.*?(?P<Position>position))'
+    r'|(?=.*?(?P<Velocity>velocity))'
+    r'|(?=.*?(?P<Acceleration>acceleration))'
+    r'|(?=.*?(?P<Rotation>flexion|rotation|tilt)))'
+)
+
+BODY_PART_RE = re.compile(
+    r'^(?:(?=.*?(?P<Pelvis>Pelvis))'
+    r'|(?=.*?(?P<Chest>Chest|Thorax))'
+    r'|(?=.*?(?P<Head>Head|Neck))'
+    r'|(?=.*?(?P<Shoulder>Shoulder|Scapula|UpperArm))'
+    r'|(?=.*?(?P<Forearm>ForeArm|Wrist|Hand))'
+    r'|(?=.*?(?P<Fingers>Digit)))'
+)
+
+BODY_PART_LABELS = {
+    'Pelvis': 'Pelvis',
+    'Chest': 'Chest/Thorax',
+    'Head': 'Head/Neck',
+    'Shoulder': 'Shoulder/Arm',
+    'Forearm': 'Forearm/Hand',
+    'Fingers': 'Fingers'
+}
+
+ROTATION_RE = re.compile(r'flexion|rotation|tilt')
+
+@functools.lru_cache(maxsize=None)
+def feature_category(column):
+    """'Position', 'Velocity', 'Acceleration', 'Rotation' or 'Other'"""
+    match = CATEGORY_RE.match(column)
+    return match.lastgroup if match else 'Other'
+
+@functools.lru_cache(maxsize=None)
+def body_part(column):
+    """Body part label for a column, or None if it is not one of the tracked parts"""
+    match = BODY_PART_RE.match(column)
+    return BODY_PART_LABELS[match.lastgroup] if match else None
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Shared pieces for the OSC receiver test scripts
+"""
+
+import ctypes
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+from pythonosc import dispatcher, osc_packet
+
+# Resolved addresses kept before the cache is reset (guards against address floods)
+MAX_CACHED_ADDRESSES = 4096
+
+# Datagrams read per recvmmsg() call, and the largest datagram accepted
+RECV_BATCH = 64
+MAX_DATAGRAM_BYTES = 65536
+
+# Requested kernel receive buffer; the default (~208 KB on Linux) overflows during
+# streamer bursts and the excess datagrams are dropped without any error
+RCVBUF_BYTES = 8 * 1024 * 1024
+
+# CPU core to run the receive loop on (None leaves scheduling to the OS). Pinning, with
+# SCHED_FIFO when permitted, keeps a busy machine from preempting the loop long enough
+# for the receive buffer to overflow
+RECEIVER_CPU = None
+RECEIVER_RT_PRIORITY = 50
+
+# Most recent messages kept by a capture (power of two so the index wraps with a mask)
+CAPTURE_CAPACITY = 1 << 20
+
+class CachedDispatcher(dispatcher.Dispatcher):
+    """Dispatcher that resolves each incoming address to its handlers only once
+
+    pythonosc turns the address into a regex and matches it against every mapping
+    for each message; the streamer repeats the same few hundred addresses every
+    frame, so the result is looked up in a dict after the first time.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._resolved = {}
+
+    def map(self, *args, **kwargs):
+        self._resolved.clear()
+        return super().map(*args, **kwargs)
+
+    def unmap(self, *args, **kwargs):
+        self._resolved.clear()
+        return super().unmap(*args, **kwargs)
+
+    def handlers_for_address(self, address_pattern):
+        handlers = self._resolved.get(address_pattern)
+        if handlers is None:
+            if len(self._resolved) >= MAX_CACHED_ADDRESSES:
+                self._resolved.clear()
+            handlers = list(super().handlers_for_address(address_pattern))
+            self._resolved[address_pattern] = handlers
+        return handlers
+
+class MessageCapture:
+    """Most recent received messages as parallel address / args / timestamp arrays
+
+    All slots are preallocated and used as a ring buffer, so recording a message
+    only overwrites three existing slots and memory stays bounded however long
+    the receiver runs. `count` keeps the total number of messages seen.
+    Timestamps are time.monotonic_ns() integers.
+    """
+
+    def __init__(self, capacity=CAPTURE_CAPACITY):
+        if capacity & (capacity - 1):
+            raise ValueError(f"Capture capacity must be a power of two, got {capacity}")
+        self.mask = capacity - 1
+        self.addresses = [None] * capacity
+        self.args = [None] * capacity
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.count = 0
+        # snapshot() can run on another thread while the server is still appending
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.count, self.mask + 1)
+
+    def append(self, address, args):
+        with self._lock:
+            idx = self.count & self.mask
+            self.addresses[idx] = address
+            self.args[idx] = args
+            self.timestamps[idx] = time.monotonic_ns()
+            self.count += 1
+
+    def snapshot(self):
+        """(addresses, args, timestamps) of the retained messages, oldest first"""
+        with self._lock:
+            if self.count <= self.mask:
+                n = self.count
+                return self.addresses[:n], self.args[:n], self.timestamps[:n].copy()
+            start = self.count & self.mask
+            return (self.addresses[start:] + self.addresses[:start],
+                    self.args[start:] + self.args[:start],
+                    np.roll(self.timestamps, -start))
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_IOVec)), ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+def _load_recvmmsg():
+    """libc recvmmsg() through ctypes, or None where it is not available"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        recvmmsg = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+                         ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+_recvmmsg = _load_recvmmsg()
+
+class BatchOSCUDPServer:
+    """Single-threaded OSC UDP server that reads queued datagrams in batches
+
+    Stands in for pythonosc's ThreadingOSCUDPServer (serve_forever/shutdown/
+    server_close). A selector waits on the non-blocking socket, and each wakeup
+    drains every datagram already queued: with recvmmsg(), up to RECV_BATCH per
+    system call, or one recv_into() per datagram where recvmmsg() is not
+    available. There are no handler threads, and shutdown() wakes the loop
+    immediately through a socket pair. Handlers receive no client address.
+
+    With reuse_port=True, several servers can bind the same port and the kernel
+    spreads incoming flows across them (SO_REUSEPORT, where supported). With a
+    cpu index, serve_forever() pins its thread to that core and the socket asks
+    the kernel to process its packets there as well (SO_INCOMING_CPU).
+    """
+
+    def __init__(self, server_address, dispatcher, batch=RECV_BATCH,
+                 rcvbuf_bytes=RCVBUF_BYTES, reuse_port=False, cpu=None):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf_bytes)
+        # The kernel may clamp the request (net.core.rmem_max), so keep what was granted
+        self.rcvbuf_bytes = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if reuse_port and hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.cpu = cpu
+        if cpu is not None and hasattr(socket, 'SO_INCOMING_CPU'):
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_INCOMING_CPU, cpu)
+            except OSError:
+                pass  # Only a steering hint; older kernels reject it
+        self.socket.bind(server_address)
+        self.socket.setblocking(False)
+        self.server_address = self.socket.getsockname()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self.dispatcher = dispatcher
+        self.batch = batch
+        self._buffer = bytearray(batch * MAX_DATAGRAM_BYTES)
+        self._view = memoryview(self._buffer)
+        self._msgs = self._build_msgs() if _recvmmsg else None
+        self._shutdown_request = False
+        self._is_shut_down = threading.Event()
+        self._is_shut_down.set()
+
+    def _build_msgs(self):
+        """One mmsghdr per batch slot, each pointing at its own slice of the buffer"""
+        base = ctypes.addressof(ctypes.c_char.from_buffer(self._buffer))
+        iovecs = (_IOVec * self.batch)()
+        msgs = (_MMsgHdr * self.batch)()
+        for i in range(self.batch):
+            iovecs[i].iov_base = base + i * MAX_DATAGRAM_BYTES
+            iovecs[i].iov_len = MAX_DATAGRAM_BYTES
+            msgs[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+            msgs[i].msg_hdr.msg_iovlen = 1
+        self._iovecs = iovecs  # msgs only hold raw pointers into this array
+        return msgs
+
+    def serve_forever(self, poll_interval=0.5):
+        """Handle datagrams until shutdown()"""
+        self._is_shut_down.clear()
+        if self.cpu is not None:
+            pin_current_thread(self.cpu)
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self.socket, selectors.EVENT_READ)
+                selector.register(self._wakeup_recv, selectors.EVENT_READ)
+                while not self._shutdown_request:
+                    for key, _ in selector.select(poll_interval):
+                        if key.fileobj is self.socket:
+                            self._drain()
+                        else:
+                            self._clear_wakeup()
+        finally:
+            self._shutdown_request = False
+            self._is_shut_down.set()
+
+    def _clear_wakeup(self):
+        try:
+            while self._wakeup_recv.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _drain(self):
+        """Read everything already queued on the socket"""
+        if self._msgs is None:
+            while True:
+                try:
+                    size = self.socket.recv_into(self._buffer, MAX_DATAGRAM_BYTES)
+                except BlockingIOError:
+                    return
+                self._dispatch(0, size)
+
+        fd = self.socket.fileno()
+        while True:
+            count = _recvmmsg(fd, self._msgs, self.batch, socket.MSG_DONTWAIT, None)
+            if count <= 0:
+                return  # EAGAIN: the queue is empty
+            for i in range(count):
+                self._dispatch(i * MAX_DATAGRAM_BYTES, self._msgs[i].msg_len)
+            if count < self.batch:
+                return
+
+    def _dispatch(self, offset, size):
+        self.dispatcher.call_handlers_for_packet(bytes(self._view[offset:offset + size]), None)
+
+    def shutdown(self):
+        """Stop serve_forever() and wait for it to return"""
+        self._shutdown_request = True
+        self._wakeup_send.send(b'\0')
+        self._is_shut_down.wait()
+
+    def server_close(self):
+        self.socket.close()
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
+
+def pin_current_thread(cpu, rt_priority=RECEIVER_RT_PRIORITY):
+    """Pin the calling thread to one CPU core and raise it to SCHED_FIFO where permitted
+    
+    Both steps are best effort: they need Linux, and the real-time policy also needs
+    root or CAP_SYS_NICE. What was applied is printed.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        print("CPU pinning is not supported on this platform")
+        return
+    try:
+        os.sched_setaffinity(0, {cpu})  # pid 0 is the calling thread on Linux
+    except (OSError, ValueError) as e:
+        print(f"Could not pin receiver to CPU {cpu}: {e}")
+        return
+    policy = "default scheduling"
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+        policy = f"SCHED_FIFO priority {rt_priority}"
+    except (OSError, AttributeError):
+        pass
+    print(f"Receiver pinned to CPU {cpu} ({policy})")
+
+def count_messages(dgram):
+    """Number of OSC messages in a datagram, read from bundle element sizes without decoding"""
+    view = memoryview(dgram)
+    if view[:8] != b'#bundle\0':
+        return 1
+    count = 0
+    pos = 16  # '#bundle\0' + timetag
+    while pos + 4 <= len(view):
+        size = int.from_bytes(view[pos:pos + 4], 'big')
+        pos += 4
+        if view[pos:pos + 1] == b'#':
+            count += count_messages(view[pos:pos + size])  # Nested bundle
+        else:
+            count += 1
+        pos += size
+    return count
+
+class MessageCounter:
+    """Counts received OSC messages without decoding them
+
+    Used in place of a dispatcher by BatchOSCUDPServer. Messages are counted from
+    bundle element sizes. Only when the count passes a multiple of report_every
+    is the datagram decoded, and its last message passed to
+    on_report(count, address, args). Every address is counted, not just /mh/*.
+    """
+
+    def __init__(self, on_report=None, report_every=100):
+        self.on_report = on_report
+        self.report_every = report_every
+        self.datagrams = 0
+        self.count = 0
+
+    def call_handlers_for_packet(self, data, client_address):
+        before = self.count
+        self.datagrams += 1
+        self.count += count_messages(data)
+        if self.on_report and self.count // self.report_every > before // self.report_every:
+            try:
+                message = osc_packet.OscPacket(data).messages[-1].message
+            except (osc_packet.ParseError, IndexError):
+                return []
+            self.on_report(self.count, message.address, tuple(message.params))
+        return []
+
+def start_mh_server(handler, host="127.0.0.1", port=7000):
+    """Create a BatchOSCUDPServer that passes every /mh/* message to handler(address, *args)"""
+    disp = CachedDispatcher()
+    disp.map("/mh/*", handler)
+    return open_server(disp, host, port)
+
+def open_server(packet_handler, host="127.0.0.1", port=7000):
+    """Create a BatchOSCUDPServer around a dispatcher or MessageCounter"""
+    server = BatchOSCUDPServer((host, port), packet_handler, cpu=RECEIVER_CPU)
+    print(f"OSC Server started on {host}:{port}")
+    print(f"Receive buffer: {server.rcvbuf_bytes // 1024} KB")
+    return server
@@ -4,165 +4,160 @@ Show the data structure and sample output of MetaHuman Streamer v2
 """
 
 import numpy as np
-import json
+import sys
 import os
+from feature_categories import feature_category, body_part
+from config_cache import load_norm_params
+
+CATEGORY_LABELS = {
+    'Position': 'Position (x, y, z coordinates)',
+    'Velocity': 'Velocity (movement speed)',
+    'Acceleration': 'Acceleration (movement changes)',
+    'Rotation': 'Rotation (joint angles)',
+    'Other': 'Other'
+}
 
 def show_data_structure():
     """Display the structure of data being sent by the streamer"""
-    print("MetaHuman Streamer v2 - Data Structure")
-    print("=" * 60)
+    out = []
+    out.append("MetaHuman Streamer v2 - Data Structure")
+    out.append("=" * 60)
     
     try:
         # Load normalization parameters
-        with open("data/processed_v2/normalization_params.json", 'r') as f:
-            norm_params = json.load(f)
+        norm_params = load_norm_params()
         
         feature_columns = norm_params['feature_columns']
         mean_values = norm_params['mean']
         std_values = norm_params['std']
         
-        print(f"📊 DATA OVERVIEW")
-        print(f"   Total features: {len(feature_columns)}")
-        print(f"   Frames per sequence: {norm_params['target_frames']}")
-        print(f"   Data type: Float32 (normalized)")
-        print()
+        out.append(f"📊 DATA OVERVIEW")
+        out.append(f"   Total features: {len(feature_columns)}")
+        out.append(f"   Frames per sequence: {norm_params['target_frames']}")
+        out.append(f"   Data type: Float32 (normalized)")
+        out.append("")
         
         # Show feature categories
-        print("🏷️  FEATURE CATEGORIES")
+        out.append("🏷️  FEATURE CATEGORIES")
         categories = {}
         for col in feature_columns:
-            if 'position' in col:
-                category = 'Position (x, y, z coordinates)'
-            elif 'velocity' in col:
-                category = 'Velocity (movement speed)'
-            elif 'acceleration' in col:
-                category = 'Acceleration (movement changes)'
-            elif any(rot in col for rot in ['flexion', 'rotation', 'tilt']):
-                category = 'Rotation (joint angles)'
-            else:
-                category = 'Other'
-            
+            category = CATEGORY_LABELS[feature_category(col)]
             categories[category] = categories.get(category, 0) + 1
         
         for cat, count in sorted(categories.items()):
-            print(f"   {cat}: {count} features")
-        print()
+            out.append(f"   {cat}: {count} features")
+        out.append("")
         
         # Show body parts
-        print("🦴 BODY PARTS TRACKED")
+        out.append("🦴 BODY PARTS TRACKED")
         body_parts = {}
         for col in feature_columns:
-            if 'Pelvis' in col:
-                body_parts['Pelvis'] = body_parts.get('Pelvis', 0) + 1
-            elif 'Chest' in col or 'Thorax' in col:
-                body_parts['Chest/Thorax'] = body_parts.get('Chest/Thorax', 0) + 1
-            elif 'Head' in col or 'Neck' in col:
-                body_parts['Head/Neck'] = body_parts.get('Head/Neck', 0) + 1
-            elif 'Shoulder' in col or 'Scapula' in col or 'UpperArm' in col:
-                body_parts['Shoulder/Arm'] = body_parts.get('Shoulder/Arm', 0) + 1
-            elif 'ForeArm' in col or 'Wrist' in col or 'Hand' in col:
-                body_parts['Forearm/Hand'] = body_parts.get('Forearm/Hand', 0) + 1
-            elif 'Digit' in col:
-                body_parts['Fingers'] = body_parts.get('Fingers', 0) + 1
+            part = body_part(col)
+            if part:
+                body_parts[part] = body_parts.get(part, 0) + 1
         
         for part, count in sorted(body_parts.items()):
-            print(f"   {part}: {count} features")
-        print()
+            out.append(f"   {part}: {count} features")
+        out.append("")
         
         # Show sample features with their values
-        print("📋 SAMPLE FEATURES (with typical values)")
-        print("   Format: /mh/[feature_name] -> [normalized_value]")
-        print()
+        out.append("📋 SAMPLE FEATURES (with typical values)")
+        out.append("   Format: /mh/[feature_name] -> [normalized_value]")
+        out.append("")
         
         # Show first 15 features as examples
-        for i in range(min(15, len(feature_columns))):
-            col = feature_columns[i]
-            mean_val = mean_values[i]
-            std_val = std_values[i]
-            
-            # Show what a typical normalized value might look like
-            # (normalized values are typically between -3 and +3)
-            sample_normalized = np.random.normal(0, 1)  # Typical normalized value
-            sample_denormalized = sample_normalized * std_val + mean_val
-            
-            print(f"   {i+1:2d}. /mh/{col}")
-            print(f"       Normalized: {sample_normalized:.3f}")
-            print(f"       Denormalized: {sample_denormalized:.3f}")
-            print()
+        n_shown = min(15, len(feature_columns))
+        
+        # Show what a typical normalized value might look like
+        # (normalized values are typically between -3 and +3)
+        sample_normalized = np.random.normal(0, 1, n_shown)  # Typical normalized values
+        sample_denormalized = (sample_normalized * np.asarray(std_values[:n_shown])
+                               + np.asarray(mean_values[:n_shown]))
+        
+        for i in range(n_shown):
+            out.append(f"   {i+1:2d}. /mh/{feature_columns[i]}")
+            out.append(f"       Normalized: {sample_normalized[i]:.3f}")
+            out.append(f"       Denormalized: {sample_denormalized[i]:.3f}")
+            out.append("")
         
         if len(feature_columns) > 15:
-            print(f"   ... and {len(feature_columns) - 15} more features")
-            print()
+            out.append(f"   ... and {len(feature_columns) - 15} more features")
+            out.append("")
         
         # Show special control messages
-        print("🎮 CONTROL MESSAGES")
-        print("   /mh/frame -> [frame_number] (0-59)")
-        print("   /mh/mode -> [movement_mode] (BASELINE, TURNING_LEFT, TURNING_RIGHT)")
-        print()
+        out.append("🎮 CONTROL MESSAGES")
+        out.append("   /mh/frame -> [frame_number] (0-59)")
+        out.append("   /mh/mode -> [movement_mode] (BASELINE, TURNING_LEFT, TURNING_RIGHT)")
+        out.append("")
         
         # Show data flow
-        print("🔄 DATA FLOW")
-        print("   1. Load baseline/turn sequences (60 frames each)")
-        print("   2. Stream frames at configured FPS (default: 30 FPS)")
-        print("   3. Each frame sends 864 feature values + 2 control values")
-        print("   4. Total: ~866 OSC messages per frame")
-        print("   5. At 30 FPS: ~25,980 messages per second")
-        print()
+        out.append("🔄 DATA FLOW")
+        out.append("   1. Load baseline/turn sequences (60 frames each)")
+        out.append("   2. Stream frames at configured FPS (default: 30 FPS)")
+        out.append("   3. Each frame sends 864 feature values + 2 control values")
+        out.append("   4. Total: ~866 OSC messages per frame")
+        out.append("   5. At 30 FPS: ~25,980 messages per second")
+        out.append("")
         
         # Show example OSC message format
-        print("📡 OSC MESSAGE FORMAT")
-        print("   Address: /mh/[feature_name]")
-        print("   Value: float (32-bit)")
-        print("   Example: /mh/Pelvis_position_x -> 0.123")
-        print("   Example: /mh/LeftShoulder_flexion -> -0.456")
-        print("   Example: /mh/frame -> 15")
-        print("   Example: /mh/mode -> BASELINE")
-        print()
+        out.append("📡 OSC MESSAGE FORMAT")
+        out.append("   Address: /mh/[feature_name]")
+        out.append("   Value: float (32-bit)")
+        out.append("   Example: /mh/Pelvis_position_x -> 0.123")
+        out.append("   Example: /mh/LeftShoulder_flexion -> -0.456")
+        out.append("   Example: /mh/frame -> 15")
+        out.append("   Example: /mh/mode -> BASELINE")
+        out.append("")
         
         # Show what Unreal Engine would receive
-        print("🎯 WHAT UNREAL ENGINE RECEIVES")
-        print("   • Real-time bone positions (x, y, z coordinates)")
-        print("   • Joint rotations (flexion, rotation, tilt angles)")
-        print("   • Movement velocities and accelerations")
-        print("   • Frame timing information")
-        print("   • Current movement mode")
-        print("   • All data normalized and ready for animation")
-        print()
-        
-        print("💡 USAGE IN UNREAL ENGINE")
-        print("   • Map OSC addresses to bone transforms")
-        print("   • Apply denormalization if needed")
-        print("   • Use frame info for timing")
-        print("   • Use mode info for animation blending")
+        out.append("🎯 WHAT UNREAL ENGINE RECEIVES")
+        out.append("   • Real-time bone positions (x, y, z coordinates)")
+        out.append("   • Joint rotations (flexion, rotation, tilt angles)")
+        out.append("   • Movement velocities and accelerations")
+        out.append("   • Frame timing information")
+        out.append("   • Current movement mode")
+        out.append("   • All data normalized and ready for animation")
+        out.append("")
+        
+        out.append("💡 USAGE IN UNREAL ENGINE")
+        out.append("   • Map OSC addresses to bone transforms")
+        out.append("   • Apply denormalization if needed")
+        out.append("   • Use frame info for timing")
+        out.append("   • Use mode info for animation blending")
         
     except Exception as e:
-        print(f"Error loading data structure: {e}")
+        out.append(f"Error loading data structure: {e}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def show_sample_sequence():
     """Show a sample of what one frame looks like"""
-    print("\n" + "=" * 60)
-    print("SAMPLE FRAME DATA")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("SAMPLE FRAME DATA")
+    out.append("=" * 60)
     
     try:
-        # Load a sample baseline sequence
-        baseline_data = np.load("data/processed_v2/baseline_data.npy")
-        sample_frame = baseline_data[0, 0, :]  # First frame of first sample
+        # Load a sample baseline sequence (memory-mapped: only the first frame is read from disk)
+        baseline_data = np.load("data/processed_v2/baseline_data.npy", mmap_mode='r')
+        sample_frame = np.array(baseline_data[0, 0, :])  # First frame of first sample
         
-        print(f"Sample frame shape: {sample_frame.shape}")
-        print(f"Data type: {sample_frame.dtype}")
-        print(f"Value range: [{sample_frame.min():.3f}, {sample_frame.max():.3f}]")
-        print()
+        out.append(f"Sample frame shape: {sample_frame.shape}")
+        out.append(f"Data type: {sample_frame.dtype}")
+        out.append(f"Value range: [{sample_frame.min():.3f}, {sample_frame.max():.3f}]")
+        out.append("")
         
-        print("First 20 values in this frame:")
+        out.append("First 20 values in this frame:")
         for i in range(min(20, len(sample_frame))):
-            print(f"   Feature {i+1:3d}: {sample_frame[i]:8.3f}")
+            out.append(f"   Feature {i+1:3d}: {sample_frame[i]:8.3f}")
         
         if len(sample_frame) > 20:
-            print(f"   ... and {len(sample_frame) - 20} more values")
+            out.append(f"   ... and {len(sample_frame) - 20} more values")
         
     except Exception as e:
-        print(f"Error loading sample data: {e}")
+        out.append(f"Error loading sample data: {e}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     show_data_structure()
@@ -3,8 +3,8 @@
 Test script to verify channel mapping in v2 streamer
 """
 
-import json
 import os
+from config_cache import load_config, load_norm_params
 
 def test_channel_mapping():
     """Test the channel mapping functionality"""
@@ -13,14 +13,12 @@ def test_channel_mapping():
     try:
         # Load channel config
         config_path = "data/processed/channels_steering_from_columns.json"
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         
         print(f"Loaded {len(config['channels'])} channels from config")
         
         # Load feature names
-        with open("data/processed_v2/normalization_params.json", 'r') as f:
-            norm_params = json.load(f)
+        norm_params = load_norm_params()
         feature_names = norm_params['feature_columns']
         
         print(f"Loaded {len(feature_names)} features from normalization params")
@@ -29,6 +27,11 @@ def test_channel_mapping():
         mapped_count = 0
         unmapped_count = 0
         
+        # Index of the first occurrence of each name, as list.index() would return
+        name_to_idx = {}
+        for i, name in enumerate(feature_names):
+            name_to_idx.setdefault(name, i)
+        
         print("\nChannel mapping results:")
         print("-" * 50)
         
@@ -36,11 +39,11 @@ def test_channel_mapping():
             address = channel['address']
             feature_name = address.replace('/mh/', '')
             
-            try:
-                feature_idx = feature_names.index(feature_name)
+            feature_idx = name_to_idx.get(feature_name)
+            if feature_idx is not None:
                 print(f"✓ {address} -> {feature_name} (index {feature_idx})")
                 mapped_count += 1
-            except ValueError:
+            else:
                 print(f"✗ {address} -> {feature_name} (NOT FOUND)")
                 unmapped_count += 1
         
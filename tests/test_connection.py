@@ -7,8 +7,7 @@ This creates a simple OSC server to receive messages from the GUI
 import socket
 import threading
 import time
-from pythonosc import dispatcher
-from pythonosc import osc_server
+from osc_receiver import start_mh_server
 
 class TestOSCReceiver:
     def __init__(self, ip="127.0.0.1", port=8000):
@@ -17,11 +16,20 @@ class TestOSCReceiver:
         self.message_count = 0
         self.running = False
         self.server = None
+        # (second, formatted "%H:%M:%S") so strftime runs once per second, not per message
+        self._clock = (None, "")
+        
+    def timestamp(self):
+        """Current wall-clock time as HH:MM:SS"""
+        now = int(time.time())
+        if now != self._clock[0]:
+            self._clock = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._clock[1]
         
     def message_handler(self, address, *args):
         """Handle incoming OSC messages"""
         self.message_count += 1
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = self.timestamp()
         print(f"[{timestamp}] Received: {address} = {args[0] if args else 'no value'}")
         
         # Print every 10th message to avoid spam
@@ -31,15 +39,9 @@ class TestOSCReceiver:
     def start(self):
         """Start the OSC server"""
         try:
-            # Create dispatcher
-            disp = dispatcher.Dispatcher()
-            disp.map("/mh/*", self.message_handler)
-            
-            # Create server
-            self.server = osc_server.ThreadingOSCUDPServer((self.ip, self.port), disp)
+            self.server = start_mh_server(self.message_handler, self.ip, self.port)
             self.running = True
             
-            print(f"OSC Server started on {self.ip}:{self.port}")
             print("Waiting for messages from MetaHuman Streamer GUI...")
             print("Press Ctrl+C to stop")
             
@@ -3,8 +3,8 @@
 Test script to demonstrate the new OSC format for Unreal Engine
 """
 
-import json
 import numpy as np
+from config_cache import load_config, load_norm_params
 
 def test_osc_format():
     """Test the new OSC format and show sample messages"""
@@ -13,12 +13,10 @@ def test_osc_format():
     
     try:
         # Load OSC config
-        with open('data/processed/osc_channels_config.json', 'r') as f:
-            config = json.load(f)
+        config = load_config('data/processed/osc_channels_config.json')
         
         # Load normalization params
-        with open('data/processed_v2/normalization_params.json', 'r') as f:
-            norm_params = json.load(f)
+        norm_params = load_norm_params()
         
         print(f"OSC Configuration:")
         print(f"  Host: {config['meta']['osc']['host']}")
@@ -60,7 +58,7 @@ def test_osc_format():
         print("-" * 20)
         bone_counts = {}
         for channel in config['channels']:
-            bone = channel['osc_address'].split('/')[2]  # Extract bone name
+            bone = channel['osc_address'].split('/', 3)[2]  # Extract bone name
             if bone not in bone_counts:
                 bone_counts[bone] = 0
             bone_counts[bone] += 1
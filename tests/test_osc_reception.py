@@ -4,12 +4,14 @@ Test script to verify OSC messages are being received
 This will help debug why Unreal Engine might not be receiving data
 """
 
-import time
-from pythonosc import dispatcher, osc_server
 import threading
+from osc_receiver import MessageCapture, MessageCounter, open_server, start_mh_server
+
+# Only count datagrams and messages, without decoding them or keeping per-address statistics
+COUNT_ONLY = False
 
 # Global variables
-received_messages = []
+received_messages = MessageCapture()
 message_count = 0
 
 def handle_mh_message(address, *args):
@@ -17,25 +19,24 @@ def handle_mh_message(address, *args):
     global message_count
     message_count += 1
     
-    received_messages.append({
-        'address': address,
-        'args': args,
-        'timestamp': time.time()
-    })
+    received_messages.append(address, args)
     
     # Print every 100th message to avoid spam
     if message_count % 100 == 0:
         print(f"[{message_count:04d}] {address}: {args}")
 
+def report_message(count, address, args):
+    """Print the latest message each time another 100 have been counted"""
+    print(f"[{count:04d}] {address}: {args}")
+
+message_counter = MessageCounter(on_report=report_message, report_every=100)
+
 def start_osc_server(host="127.0.0.1", port=7000):
     """Start OSC server to receive messages"""
-    disp = dispatcher.Dispatcher()
-    
-    # Register handler for all MetaHuman messages
-    disp.map("/mh/*", handle_mh_message)
-    
-    server = osc_server.ThreadingOSCServer((host, port), disp)
-    print(f"OSC Server started on {host}:{port}")
+    if COUNT_ONLY:
+        server = open_server(message_counter, host, port)
+    else:
+        server = start_mh_server(handle_mh_message, host, port)
     print("Waiting for MetaHuman Streamer v2 messages...")
     print("=" * 60)
     
@@ -64,12 +65,18 @@ def main():
         print("\n" + "=" * 60)
         print("RECEPTION STATISTICS")
         print("=" * 60)
-        print(f"Total messages received: {len(received_messages)}")
-        print(f"Message count: {message_count}")
+        if COUNT_ONLY:
+            print(f"Total messages received: {message_counter.count}")
+            print(f"Datagrams received: {message_counter.datagrams}")
+        else:
+            print(f"Total messages received: {received_messages.count}")
+            print(f"Message count: {message_count}")
         
         if received_messages:
+            captured_addresses, captured_args, _ = received_messages.snapshot()
+            
             # Show unique addresses
-            addresses = set(msg['address'] for msg in received_messages)
+            addresses = set(captured_addresses)
             print(f"Unique addresses: {len(addresses)}")
             
             # Show sample addresses
@@ -81,13 +88,13 @@ def main():
                 print(f"  ... and {len(addresses) - 10} more addresses")
             
             # Show control messages
-            control_msgs = [msg for msg in received_messages if msg['address'] in ['/mh/frame', '/mh/mode']]
+            control_msgs = [i for i, addr in enumerate(captured_addresses) if addr in ['/mh/frame', '/mh/mode']]
             if control_msgs:
                 print(f"\nControl messages received: {len(control_msgs)}")
                 print("Latest control messages:")
-                for msg in control_msgs[-5:]:
-                    print(f"  {msg['address']}: {msg['args']}")
-        else:
+                for i in control_msgs[-5:]:
+                    print(f"  {captured_addresses[i]}: {captured_args[i]}")
+        elif not message_counter.count:
             print("\nNo messages received!")
             print("Possible issues:")
             print("1. Streamer not running")
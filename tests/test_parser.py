@@ -2,20 +2,31 @@
 Tests for the NLP Parser
 """
 
+import functools
+
 import pytest
+
+# The parser/router package is optional; skip the module at collection when it is absent
+pytest.importorskip("osc_streamer_v3")
+
 from osc_streamer_v3.parser import NLPParser
 from osc_streamer_v3.config import Config
 from osc_streamer_v3.intents import TurnIntent, UnknownIntent, HelpIntent, QuitIntent
 
 
+@functools.cache
+def _cfg():
+    """Config loaded from file once for the whole module"""
+    return Config.load_from_file()
+
+
 class TestNLPParser:
     """Test cases for NLPParser"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
-        """Create parser instance for testing"""
-        config = Config.load_from_file()
-        return NLPParser(config)
+        """Create one parser instance shared by the tests in this module"""
+        return NLPParser(_cfg())
     
     def test_turn_left_basic(self, parser):
         """Test basic turn left command"""
@@ -67,39 +78,43 @@ class TestNLPParser:
         assert intent.speed_deg_s == 90.0  # default
         assert intent.duration_s is None
     
-    def test_synonyms(self, parser):
+    @pytest.mark.parametrize("text,direction", [
+        # Synonyms for left
+        ("turn left", "left"),
+        ("turn counterclockwise", "left"),
+        ("turn ccw", "left"),
+        ("face left", "left"),
+        # Synonyms for right
+        ("turn right", "right"),
+        ("turn clockwise", "right"),
+        ("turn cw", "right"),
+        ("face right", "right"),
+    ])
+    def test_synonyms(self, parser, text, direction):
         """Test synonym normalization"""
-        # Test various synonyms for left
-        for text in ["turn left", "turn counterclockwise", "turn ccw", "face left"]:
-            intent = parser.parse(text)
-            assert isinstance(intent, TurnIntent)
-            assert intent.direction == "left"
-        
-        # Test various synonyms for right
-        for text in ["turn right", "turn clockwise", "turn cw", "face right"]:
-            intent = parser.parse(text)
-            assert isinstance(intent, TurnIntent)
-            assert intent.direction == "right"
+        intent = parser.parse(text)
+        assert isinstance(intent, TurnIntent)
+        assert intent.direction == direction
     
-    def test_speed_modifiers(self, parser):
+    @pytest.mark.parametrize("text,speed", [
+        ("turn left slowly", 30.0),  # slowly modifier
+        ("turn right quickly", 270.0),  # quickly modifier
+    ])
+    def test_speed_modifiers(self, parser, text, speed):
         """Test speed modifiers"""
-        intent = parser.parse("turn left slowly")
-        assert isinstance(intent, TurnIntent)
-        assert intent.speed_deg_s == 30.0  # slowly modifier
-        
-        intent = parser.parse("turn right quickly")
+        intent = parser.parse(text)
         assert isinstance(intent, TurnIntent)
-        assert intent.speed_deg_s == 270.0  # quickly modifier
+        assert intent.speed_deg_s == speed
     
-    def test_angle_modifiers(self, parser):
+    @pytest.mark.parametrize("text,angle", [
+        ("turn left a little", 5.0),  # "a little" modifier
+        ("turn right a lot", 60.0),  # "a lot" modifier
+    ])
+    def test_angle_modifiers(self, parser, text, angle):
         """Test angle modifiers"""
-        intent = parser.parse("turn left a little")
-        assert isinstance(intent, TurnIntent)
-        assert intent.angle_deg == 5.0  # "a little" modifier
-        
-        intent = parser.parse("turn right a lot")
+        intent = parser.parse(text)
         assert isinstance(intent, TurnIntent)
-        assert intent.angle_deg == 60.0  # "a lot" modifier
+        assert intent.angle_deg == angle
     
     def test_help_command(self, parser):
         """Test help command"""
@@ -134,41 +149,19 @@ class TestNLPParser:
         assert isinstance(intent, UnknownIntent)
         assert intent.reason == "Empty input"
     
-    def test_angle_clamping(self, parser):
-        """Test angle clamping to limits"""
-        # Test angle too high
-        intent = parser.parse("turn left 200 degrees")
-        assert isinstance(intent, TurnIntent)
-        assert intent.angle_deg == 180.0  # clamped to max
-        
-        # Test angle too low
-        intent = parser.parse("turn left -10 degrees")
-        assert isinstance(intent, TurnIntent)
-        assert intent.angle_deg == 0.0  # clamped to min
-    
-    def test_speed_clamping(self, parser):
-        """Test speed clamping to limits"""
-        # Test speed too high
-        intent = parser.parse("turn left 30 degrees at 500 deg/s")
-        assert isinstance(intent, TurnIntent)
-        assert intent.speed_deg_s == 360.0  # clamped to max
-        
-        # Test speed too low
-        intent = parser.parse("turn left 30 degrees at 0.5 deg/s")
-        assert isinstance(intent, TurnIntent)
-        assert intent.speed_deg_s == 1.0  # clamped to min
-    
-    def test_duration_clamping(self, parser):
-        """Test duration clamping to limits"""
-        # Test duration too high
-        intent = parser.parse("turn left 30 degrees for 20 seconds")
-        assert isinstance(intent, TurnIntent)
-        assert intent.duration_s == 10.0  # clamped to max
-        
-        # Test duration too low
-        intent = parser.parse("turn left 30 degrees for -1 seconds")
+    @pytest.mark.parametrize("text,field,expected", [
+        ("turn left 200 degrees", "angle_deg", 180.0),  # angle clamped to max
+        ("turn left -10 degrees", "angle_deg", 0.0),  # angle clamped to min
+        ("turn left 30 degrees at 500 deg/s", "speed_deg_s", 360.0),  # speed clamped to max
+        ("turn left 30 degrees at 0.5 deg/s", "speed_deg_s", 1.0),  # speed clamped to min
+        ("turn left 30 degrees for 20 seconds", "duration_s", 10.0),  # duration clamped to max
+        ("turn left 30 degrees for -1 seconds", "duration_s", 0.0),  # duration clamped to min
+    ])
+    def test_clamping(self, parser, text, field, expected):
+        """Test angle, speed and duration clamping to limits"""
+        intent = parser.parse(text)
         assert isinstance(intent, TurnIntent)
-        assert intent.duration_s == 0.0  # clamped to min
+        assert getattr(intent, field) == expected
     
     def test_help_examples(self, parser):
         """Test that help examples are provided"""
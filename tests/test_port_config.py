@@ -3,47 +3,76 @@
 Test script for port configuration in MetaHuman Streamer v2
 """
 
-import tkinter as tk
-from tkinter import ttk
+import importlib.util
 import sys
 import os
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # Add the current directory to the path so we can import the streamer
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+class _FakeVar:
+    """Stand-in for tk.StringVar/BooleanVar that needs no Tk interpreter"""
+    
+    def __init__(self, master=None, value=None, name=None):
+        self._value = value
+    
+    def get(self):
+        return self._value
+    
+    def set(self, value):
+        self._value = value
+
+def headless_gui(streamer_module):
+    """Patch the streamer's Tk widgets and dialogs so the app builds without a display"""
+    stack = ExitStack()
+    stack.enter_context(patch.object(streamer_module.tk, "Tk", MagicMock))
+    stack.enter_context(patch.object(streamer_module.tk, "StringVar", _FakeVar))
+    stack.enter_context(patch.object(streamer_module.tk, "BooleanVar", _FakeVar))
+    for name in ("ttk", "scrolledtext", "messagebox"):
+        stack.enter_context(patch.object(streamer_module, name, MagicMock()))
+    return stack
+
+# Looked up without importing, so collection stays cheap on systems without Tk
+@pytest.mark.skipif(importlib.util.find_spec("tkinter") is None,
+                    reason="tkinter not available")
 def test_port_configuration():
     """Test the port configuration functionality"""
     print("Testing port configuration...")
     
     try:
         # Import the streamer class
-        from mh_streamer_v2 import MetaHumanStreamerV2
-        
-        # Create a test instance (this will create the GUI)
-        print("Creating streamer instance...")
-        app = MetaHumanStreamerV2()
+        import mh_streamer_v2
         
-        # Test initial values
-        print(f"Initial host: {app.osc_host}")
-        print(f"Initial port: {app.osc_port}")
+        # Stub out Tk so no window is created; the test only touches the host/port vars
+        with headless_gui(mh_streamer_v2):
+            print("Creating streamer instance...")
+            app = mh_streamer_v2.MetaHumanStreamerV2()
+            
+            # Test initial values
+            print(f"Initial host: {app.osc_host}")
+            print(f"Initial port: {app.osc_port}")
         
-        # Test updating values
-        app.host_var.set("192.168.1.100")
-        app.port_var.set("8080")
+            # Test updating values
+            app.host_var.set("192.168.1.100")
+            app.port_var.set("8080")
         
-        print("Testing OSC client update...")
-        app.update_osc_client()
+            print("Testing OSC client update...")
+            app.update_osc_client()
         
-        print(f"Updated host: {app.osc_host}")
-        print(f"Updated port: {app.osc_port}")
+            print(f"Updated host: {app.osc_host}")
+            print(f"Updated port: {app.osc_port}")
         
-        # Test invalid port
-        print("Testing invalid port handling...")
-        app.port_var.set("invalid")
-        try:
-            app.update_osc_client()
-        except Exception as e:
-            print(f"Expected error for invalid port: {e}")
+            # Test invalid port
+            print("Testing invalid port handling...")
+            app.port_var.set("invalid")
+            try:
+                app.update_osc_client()
+            except Exception as e:
+                print(f"Expected error for invalid port: {e}")
         
         print("✓ Port configuration test completed successfully")
         return True
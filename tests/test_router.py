@@ -2,127 +2,95 @@
 Tests for the OSC Router
 """
 
+import dataclasses
+
 import pytest
-from unittest.mock import Mock, patch
+
+# The parser/router package is optional; skip the module at collection when it is absent
+pytest.importorskip("osc_streamer_v3")
+
 from osc_streamer_v3.router import OSCRouter
-from osc_streamer_v3.osc_client import OSCClient
 from osc_streamer_v3.intents import TurnIntent, UnknownIntent, HelpIntent, QuitIntent, DryRunIntent
 
 
+class _StubOSCClient:
+    """Stands in for OSCClient: records send_message calls and returns retval"""
+    
+    def __init__(self):
+        self.calls = []
+        self.retval = True
+    
+    def send_message(self, address, *args):
+        self.calls.append((address, args))
+        return self.retval
+
+
+def _nan_as_none(calls):
+    """Recorded calls with NaN arguments replaced by None, so they compare equal"""
+    return [(address, tuple(None if arg != arg else arg for arg in args))
+            for address, args in calls]
+
+
+# (intent, expected success, fragments expected in the message, expected OSC calls or
+# None to leave them unchecked); a missing duration may be sent as None or NaN
+ROUTE_CASES = [
+    pytest.param(
+        TurnIntent(scope="body", direction="left", angle_deg=30.0, speed_deg_s=90.0, duration_s=1.0),
+        True, ["/cmd/turn", "body left 30.0°"],
+        [("/cmd/turn", ("left", 30.0, 90.0, 1.0))],
+        id="turn_body"),
+    pytest.param(
+        TurnIntent(scope="head", direction="right", angle_deg=15.0, speed_deg_s=60.0, duration_s=None),
+        True, ["/cmd/head_turn", "head right 15.0°"],
+        [("/cmd/head_turn", ("right", 15.0, 60.0, None))],
+        id="turn_head"),
+    pytest.param(
+        TurnIntent(scope="body", direction="left", angle_deg=45.0, speed_deg_s=120.0, duration_s=None),
+        True, [],
+        [("/cmd/turn", ("left", 45.0, 120.0, None))],
+        id="turn_nan_duration"),
+    pytest.param(
+        UnknownIntent(original_text="unknown command", reason="No matching pattern"),
+        False, ["Unknown command", "unknown command"], None,
+        id="unknown"),
+    pytest.param(HelpIntent(), True, ["Available commands", "turn left"], None, id="help"),
+    pytest.param(QuitIntent(), True, ["Goodbye!"], None, id="quit"),
+]
+
+
 class TestOSCRouter:
     """Test cases for OSCRouter"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_osc_client(self):
-        """Create mock OSC client"""
-        client = Mock(spec=OSCClient)
-        client.send_message.return_value = True
-        return client
+        """Create stub OSC client, shared by the module's tests"""
+        return _StubOSCClient()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def router(self, mock_osc_client):
-        """Create router with mock OSC client"""
+        """Create router with stub OSC client, shared by the module's tests"""
         return OSCRouter(mock_osc_client)
     
-    def test_route_turn_body(self, router, mock_osc_client):
-        """Test routing turn body intent"""
-        intent = TurnIntent(
-            scope="body",
-            direction="left",
-            angle_deg=30.0,
-            speed_deg_s=90.0,
-            duration_s=1.0
-        )
-        
-        success, message = router.route(intent)
-        
-        assert success is True
-        assert "/cmd/turn" in message
-        assert "body left 30.0°" in message
-        mock_osc_client.send_message.assert_called_once_with(
-            "/cmd/turn", "left", 30.0, 90.0, 1.0
-        )
+    @pytest.fixture(autouse=True)
+    def reset_osc_client(self, mock_osc_client):
+        """Give every test a clean call log and a client whose sends succeed"""
+        mock_osc_client.calls.clear()
+        mock_osc_client.retval = True
     
-    def test_route_turn_head(self, router, mock_osc_client):
-        """Test routing turn head intent"""
-        intent = TurnIntent(
-            scope="head",
-            direction="right",
-            angle_deg=15.0,
-            speed_deg_s=60.0,
-            duration_s=None
-        )
-        
+    @pytest.mark.parametrize("intent,ok,fragments,calls", ROUTE_CASES)
+    def test_route(self, router, mock_osc_client, intent, ok, fragments, calls):
+        """Test routing each intent type"""
         success, message = router.route(intent)
         
-        assert success is True
-        assert "/cmd/head_turn" in message
-        assert "head right 15.0°" in message
-        # Check that send_message was called with the right arguments
-        mock_osc_client.send_message.assert_called_once()
-        call_args = mock_osc_client.send_message.call_args[0]
-        assert call_args[0] == "/cmd/head_turn"
-        assert call_args[1] == "right"
-        assert call_args[2] == 15.0
-        assert call_args[3] == 60.0
-        assert call_args[4] is None or call_args[4] != call_args[4]  # NaN check
+        assert success is ok
+        assert all(fragment in message for fragment in fragments), message
+        if calls is not None:
+            assert _nan_as_none(mock_osc_client.calls) == calls
     
-    def test_route_turn_with_nan_duration(self, router, mock_osc_client):
-        """Test routing turn with NaN duration"""
-        intent = TurnIntent(
-            scope="body",
-            direction="left",
-            angle_deg=45.0,
-            speed_deg_s=120.0,
-            duration_s=None
-        )
-        
-        success, message = router.route(intent)
-        
-        assert success is True
-        # Check that send_message was called with the right arguments
-        mock_osc_client.send_message.assert_called_once()
-        call_args = mock_osc_client.send_message.call_args[0]
-        assert call_args[0] == "/cmd/turn"
-        assert call_args[1] == "left"
-        assert call_args[2] == 45.0
-        assert call_args[3] == 120.0
-        assert call_args[4] is None or call_args[4] != call_args[4]  # NaN check
-    
-    def test_route_unknown_intent(self, router):
-        """Test routing unknown intent"""
-        intent = UnknownIntent(
-            original_text="unknown command",
-            reason="No matching pattern"
-        )
-        
-        success, message = router.route(intent)
-        
-        assert success is False
-        assert "Unknown command" in message
-        assert "unknown command" in message
-    
-    def test_route_help_intent(self, router):
-        """Test routing help intent"""
-        intent = HelpIntent()
-        
-        success, message = router.route(intent)
-        
-        assert success is True
-        assert "Available commands" in message
-        assert "turn left" in message
-    
-    def test_route_quit_intent(self, router):
-        """Test routing quit intent"""
-        intent = QuitIntent()
-        
-        success, message = router.route(intent)
-        
-        assert success is True
-        assert "Goodbye!" in message
-    
-    def test_route_dry_run_intent(self, router):
+    def test_route_dry_run_intent(self):
         """Test routing dry run intent"""
+        # Toggling dry run changes router state, so use a router of its own
+        router = OSCRouter(_StubOSCClient())
         intent = DryRunIntent()
         
         success, message = router.route(intent)
@@ -132,7 +100,7 @@ class TestOSCRouter:
     
     def test_osc_send_failure(self, router, mock_osc_client):
         """Test handling of OSC send failure"""
-        mock_osc_client.send_message.return_value = False
+        mock_osc_client.retval = False
         
         intent = TurnIntent(
             scope="body",
@@ -147,12 +115,11 @@ class TestOSCRouter:
         assert success is False
         assert "Failed to send" in message
     
-    def test_unknown_scope(self, router, mock_osc_client):
+    def test_unknown_scope(self, router, mock_osc_client, monkeypatch):
         """Test handling of unknown scope"""
-        # Test with a scope that's not in the address map
-        # We'll test this by temporarily modifying the address map
-        original_map = router.address_map.copy()
-        router.address_map = {"body": "/cmd/turn"}  # Remove head mapping
+        # Test with a scope that's not in the address map; monkeypatch restores the
+        # shared router's map afterwards
+        monkeypatch.setattr(router, "address_map", {"body": "/cmd/turn"})  # Remove head mapping
         
         intent = TurnIntent(
             scope="head",  # This scope won't be found
@@ -166,9 +133,6 @@ class TestOSCRouter:
         
         assert success is False
         assert "No OSC address for scope" in message
-        
-        # Restore original mapping
-        router.address_map = original_map
     
     def test_get_osc_schema(self, router):
         """Test getting OSC schema documentation"""
@@ -198,7 +162,7 @@ class TestOSCRouter:
         assert args == expected
         
         # Test without duration (None)
-        intent.duration_s = None
+        intent = dataclasses.replace(intent, duration_s=None)
         args = intent.to_osc_args()
         # Check that the last argument is NaN
         assert len(args) == 4
@@ -5,16 +5,34 @@ Tests OSC communication and data streaming
 """
 
 import numpy as np
-import json
 import os
+import pytest
 from pythonosc import udp_client
+from config_cache import load_array, load_norm_arrays, load_norm_params
+
+DATA_DIR = "data/processed_v2"
+
+# Data-dependent tests are skipped up front instead of failing late on a missing file
+requires_v2_data = pytest.mark.skipif(not os.path.isdir(DATA_DIR),
+                                      reason="v2 preprocessed data not present")
+
+# One OSC client (and socket) for the whole module; a failure is reported by the test
+# rather than breaking the import
+try:
+    _OSC_CLIENT = udp_client.SimpleUDPClient("127.0.0.1", 7000)
+    _OSC_CLIENT_ERROR = None
+except OSError as e:
+    _OSC_CLIENT = None
+    _OSC_CLIENT_ERROR = e
 
 def test_osc_communication():
     """Test OSC communication"""
     print("Testing OSC communication...")
     
-    # Create OSC client
-    client = udp_client.SimpleUDPClient("127.0.0.1", 7000)
+    if _OSC_CLIENT is None:
+        print(f"✗ OSC client could not be created: {_OSC_CLIENT_ERROR}")
+        return False
+    client = _OSC_CLIENT
     
     # Test basic OSC message
     try:
@@ -26,27 +44,27 @@ def test_osc_communication():
     
     return True
 
+@requires_v2_data
 def test_data_loading():
     """Test loading of processed data"""
     print("Testing data loading...")
     
     try:
         # Load normalization parameters
-        with open("data/processed_v2/normalization_params.json", 'r') as f:
-            norm_params = json.load(f)
+        norm_params = load_norm_params()
         print(f"✓ Loaded normalization params: {len(norm_params['mean'])} features")
         
         # Load baseline data
-        baseline_data = np.load("data/processed_v2/baseline_data.npy")
+        baseline_data = load_array("data/processed_v2/baseline_data.npy")
         print(f"✓ Loaded baseline data: {baseline_data.shape}")
         
         # Load turn data
-        left_data = np.load("data/processed_v2/left_turn_data.npy")
-        right_data = np.load("data/processed_v2/right_turn_data.npy")
+        left_data = load_array("data/processed_v2/left_turn_data.npy")
+        right_data = load_array("data/processed_v2/right_turn_data.npy")
         print(f"✓ Loaded turn data - Left: {left_data.shape}, Right: {right_data.shape}")
         
         # Load baseline vector
-        baseline_vector = np.load("data/processed_v2/baseline_vector.npy")
+        baseline_vector = load_array("data/processed_v2/baseline_vector.npy")
         print(f"✓ Loaded baseline vector: {baseline_vector.shape}")
         
         return True
@@ -55,20 +73,17 @@ def test_data_loading():
         print(f"✗ Data loading failed: {e}")
         return False
 
+@requires_v2_data
 def test_data_denormalization():
     """Test data denormalization"""
     print("Testing data denormalization...")
     
     try:
         # Load normalization parameters
-        with open("data/processed_v2/normalization_params.json", 'r') as f:
-            norm_params = json.load(f)
-        
-        mean = np.array(norm_params['mean'])
-        std = np.array(norm_params['std'])
+        mean, std = load_norm_arrays()
         
         # Load some normalized data
-        baseline_data = np.load("data/processed_v2/baseline_data.npy")
+        baseline_data = load_array("data/processed_v2/baseline_data.npy")
         normalized_frame = baseline_data[0, 0, :]  # First frame of first sample
         
         # Denormalize
@@ -84,15 +99,16 @@ def test_data_denormalization():
         print(f"✗ Denormalization failed: {e}")
         return False
 
+@requires_v2_data
 def test_sequence_generation():
     """Test sequence generation for different movements"""
     print("Testing sequence generation...")
     
     try:
         # Load data
-        baseline_data = np.load("data/processed_v2/baseline_data.npy")
-        left_data = np.load("data/processed_v2/left_turn_data.npy")
-        right_data = np.load("data/processed_v2/right_turn_data.npy")
+        baseline_data = load_array("data/processed_v2/baseline_data.npy")
+        left_data = load_array("data/processed_v2/left_turn_data.npy")
+        right_data = load_array("data/processed_v2/right_turn_data.npy")
         
         # Test baseline sequence
         baseline_seq = baseline_data[0]  # First sample
@@ -106,14 +122,15 @@ def test_sequence_generation():
         right_seq = right_data[0]  # First sample
         print(f"✓ Right turn sequence: {right_seq.shape}")
         
-        # Check for differences between sequences
-        baseline_mean = np.mean(baseline_seq, axis=0)
-        left_mean = np.mean(left_seq, axis=0)
-        right_mean = np.mean(right_seq, axis=0)
-        
-        baseline_left_diff = np.mean(np.abs(baseline_mean - left_mean))
-        baseline_right_diff = np.mean(np.abs(baseline_mean - right_mean))
-        left_right_diff = np.mean(np.abs(left_mean - right_mean))
+        # Check for differences between sequences: per-feature means of all three in
+        # one reduction, then every pairwise mean absolute difference, computed in
+        # place in a single buffer
+        means = np.mean(np.stack((baseline_seq, left_seq, right_seq)), axis=1)
+        diffs = np.empty_like(means)
+        np.subtract(means[0], means[1:], out=diffs[:2])  # baseline - left, baseline - right
+        np.subtract(means[1], means[2], out=diffs[2])  # left - right
+        np.abs(diffs, out=diffs)
+        baseline_left_diff, baseline_right_diff, left_right_diff = diffs.mean(axis=1)
         
         print(f"✓ Sequence differences:")
         print(f"  Baseline vs Left: {baseline_left_diff:.6f}")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test the v1 streamer's ramp and hold frames against a local UDP socket
+"""
+
+import collections
+import importlib.util
+import os
+import queue
+import socket
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'v1'))
+
+pytestmark = pytest.mark.skipif(importlib.util.find_spec("tkinter") is None,
+                                reason="tkinter not available")
+
+def make_streamer(gui_module, sock, n_channels=4):
+    """A MetaHumanStreamerGUI with the state the ramp path uses, built without Tk"""
+    app = gui_module.MetaHumanStreamerGUI.__new__(gui_module.MetaHumanStreamerGUI)
+    app.osc_client = object()
+    app.osc_sock = sock
+    app.last_dgram = None
+    app.last_dgram_time = 0.0
+    app.command_queue = queue.Queue()
+    app.log_buffer = collections.deque()
+    app.log_clock = (None, '')
+    app.stats_dirty = False
+    app.last_send_time = 0
+    app.osc_send_count = 0
+    app.osc_error_count = 0
+    
+    app.channels = [{} for _ in range(n_channels)]
+    app.addresses = [f"/mh/channel_{i}" for i in range(n_channels)]
+    app.amp_right = np.linspace(1.0, 2.0, n_channels, dtype=np.float32)
+    app.amp_left = -app.amp_right
+    app.zero_dgram = gui_module.build_bundle(app.addresses, [0.0] * n_channels).dgram
+    app.value_slots = gui_module.bundle_value_slots(app.zero_dgram)
+    app.ramp_data = None
+    app.ramp_values = np.empty((0, 0), dtype=np.float32)
+    app.ramp_bytes = bytearray()
+    app.ramp_template = None
+    app.ramp_dgrams = []
+    app.ramp_frame = 0
+    app.hold_frames = 0
+    app.hold_frame = 0
+    
+    app.fps = 30
+    app.duration = 0.2
+    app.hold = 0.1
+    return app
+
+def receive_all(receiver):
+    """Datagrams waiting on the receiver socket"""
+    dgrams = []
+    while True:
+        try:
+            dgrams.append(receiver.recv(65536))
+        except BlockingIOError:
+            return dgrams
+
+def test_baseline_after_hold_is_sent():
+    """Returning to baseline after a held turn sends its first frame straight away"""
+    import mh_streamer_gui
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as receiver, \
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+        receiver.bind(("127.0.0.1", 0))
+        receiver.setblocking(False)
+        sender.connect(receiver.getsockname())
+        app = make_streamer(mh_streamer_gui, sender)
+        
+        app.start_ramp('right')
+        for _ in range(len(app.ramp_dgrams) + app.hold_frames):
+            app.send_ramp_frame()
+        turn = receive_all(receiver)
+        assert turn, "the turn ramp sent nothing"
+        
+        app.start_ramp('baseline')
+        app.send_ramp_frame()
+        baseline = receive_all(receiver)
+        assert baseline == [bytes(app.ramp_dgrams[0])]
+        assert baseline[0] != turn[-1]
@@ -9,14 +9,28 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import queue
+import collections
+import socket
 import json
 import time
 import os
+import functools
 import numpy as np
 from pythonosc.udp_client import SimpleUDPClient
-from datetime import datetime
+from pythonosc import osc_bundle_builder, osc_message_builder
 import sys
 
+try:
+    import orjson  # Optional: faster settings serialisation
+except ImportError:
+    orjson = None
+
+UI_POLL_MS = 50  # Worker -> GUI updates are applied at most this often
+UI_DRAIN_MAX = 200  # Queue items applied per poll
+LOG_BUFFER_LINES = 2000  # Pending log lines kept between flushes; oldest are dropped
+LOG_MAX_LINES = 5000  # Console is trimmed to half this once it grows past it
+KEEPALIVE_INTERVAL = 0.5  # seconds; an unchanged frame is still resent this often
+SAVE_DEBOUNCE_MS = 500  # Settings edits are written once they settle for this long
 # Constants
 COMMANDS = {
     'START_HEARTBEAT': 'START_HEARTBEAT',
@@ -36,6 +50,39 @@ MODES = {
     'STOPPED': 'Stopped'
 }
 
+# Modes in which the worker sends a frame every tick
+RAMP_MODES = (MODES['TURNING_RIGHT'], MODES['TURNING_LEFT'], MODES['BASELINE'])
+ACTIVE_MODES = (MODES['HEARTBEAT'],) + RAMP_MODES
+
+@functools.lru_cache(maxsize=8)
+def ease_in_out_envelope(n_frames):
+    """Cubic ease-in-out 3t² - 2t³ over n_frames, shared read-only between ramps"""
+    t = np.linspace(0, 1, n_frames, dtype=np.float32)
+    # Horner form t²(3 - 2t): one temporary instead of three
+    envelope = t * t
+    envelope *= 3.0 - 2.0 * t
+    envelope.flags.writeable = False
+    return envelope
+
+def build_bundle(addresses, values):
+    """Pack one frame's channel values into a single OSC bundle (one datagram)"""
+    bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+    for address, value in zip(addresses, values):
+        msg = osc_message_builder.OscMessageBuilder(address=address)
+        msg.add_arg(float(value), 'f')
+        bundle.add_content(msg.build())
+    return bundle.build()
+
+def bundle_value_slots(dgram):
+    """4-byte word index of each message's float argument in a bundle of one-float messages"""
+    slots = []
+    offset = 16  # '#bundle\0' + 8-byte timetag
+    while offset < len(dgram):
+        size = int.from_bytes(dgram[offset:offset + 4], 'big')
+        offset += 4 + size
+        slots.append(offset // 4 - 1)  # The float is the last word of the element
+    return np.array(slots, dtype=np.intp)
+
 class MetaHumanStreamerGUI:
     def __init__(self, root):
         self.root = root
@@ -45,12 +92,28 @@ class MetaHumanStreamerGUI:
         
         # OSC and streaming state
         self.osc_client = None
+        self.osc_sock = None  # SimpleUDPClient's socket, connected to the target
+        self.last_dgram = None  # Last frame sent, to skip identical repeats
+        self.last_dgram_time = 0.0
         self.running = False
         self.worker_thread = None
         self.command_queue = queue.Queue()
+        self.ui_queue = queue.Queue()  # Worker -> GUI updates, drained by drain_ui_queue
+        self.log_buffer = collections.deque(maxlen=LOG_BUFFER_LINES)  # Filled from any thread
+        self.log_clock = (None, '')  # (epoch second, "HH:MM:SS") last formatted
+        self.stats_dirty = False
         self.current_mode = MODES['IDLE']
         self.channels = []
+        self.addresses = []
+        self.amp_right = np.zeros(0, dtype=np.float32)  # Per-channel amplitudes, in channel order
+        self.amp_left = np.zeros(0, dtype=np.float32)
+        self.zero_dgram = None  # Prebuilt all-zero frame for heartbeat/stop, and the ramp template
+        self.value_slots = None  # Where each channel's float sits in a frame, in 4-byte words
         self.ramp_data = None
+        self.ramp_values = np.empty((0, 0), dtype=np.float32)  # Backing store reused by ramp_data
+        self.ramp_bytes = bytearray()  # Encoded ramp frames back to back, reused across ramps
+        self.ramp_template = None  # zero_dgram that ramp_bytes was tiled from
+        self.ramp_dgrams = []  # Encoded OSC bundle per ramp frame (slices of ramp_bytes)
         self.ramp_frame = 0
         self.hold_frames = 0
         self.hold_frame = 0
@@ -64,7 +127,13 @@ class MetaHumanStreamerGUI:
         
         # Settings
         self.settings_file = os.path.expanduser("~/.mh_streamer_gui.json")
+        self.save_after_id = None  # Pending debounced save
         self.load_settings()
+        # Timing settings as plain typed values: the worker reads these, never the Tk variables
+        self.fps = int(self.settings['fps'])
+        self.frame_period = 1.0 / self.fps
+        self.duration = float(self.settings['duration'])
+        self.hold = float(self.settings['hold'])
         
         # Create GUI
         self.create_widgets()
@@ -72,6 +141,7 @@ class MetaHumanStreamerGUI:
         
         # Start worker thread
         self.start_worker()
+        self.root.after(UI_POLL_MS, self.drain_ui_queue)
         
     def create_widgets(self):
         """Create and layout all GUI widgets"""
@@ -137,6 +207,14 @@ class MetaHumanStreamerGUI:
         hold_entry = ttk.Entry(action_frame, textvariable=self.hold_var, width=10)
         hold_entry.grid(row=0, column=3, sticky=tk.W)
         
+        # Persist edits once the user leaves an entry (debounced)
+        for entry in (ip_entry, port_entry, fps_entry, config_entry, duration_entry, hold_entry):
+            entry.bind('<FocusOut>', self.schedule_save)
+        
+        # Mirror the timing entries into typed attributes as they are edited
+        for var in (self.fps_var, self.duration_var, self.hold_var):
+            var.trace_add('write', self.on_timing_changed)
+        
         # Action buttons frame
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=3, column=0, columnspan=3, pady=(0, 10))
@@ -233,6 +311,7 @@ class MetaHumanStreamerGUI:
             'fps': 60,
             'duration': 1.5,
             'hold': 0.0,
+            'sndbuf_bytes': 1024 * 1024,  # UDP send buffer; the kernel caps it at net.core.wmem_max
             'config_file': './data/processed/channels_steering_from_columns.json'
         }
         
@@ -256,11 +335,30 @@ class MetaHumanStreamerGUI:
                 'config_file': self.config_var.get()
             })
             
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.settings, indent=2).encode()
+            
+            # Write a temp file and swap it in, so a crash never leaves a truncated file
+            tmp_file = self.settings_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.settings_file)
         except Exception as e:
             self.log_message(f"Error saving settings: {e}")
     
+    def schedule_save(self, event=None):
+        """Save settings after edits settle, replacing any save already pending"""
+        if self.save_after_id is not None:
+            self.root.after_cancel(self.save_after_id)
+        self.save_after_id = self.root.after(SAVE_DEBOUNCE_MS, self.run_scheduled_save)
+    
+    def run_scheduled_save(self):
+        """Debounced save callback"""
+        self.save_after_id = None
+        self.save_settings()
+    
     def browse_config(self):
         """Open file dialog to select config file"""
         filename = filedialog.askopenfilename(
@@ -299,6 +397,15 @@ class MetaHumanStreamerGUI:
                     'amp_left': float(channel['amp_left'])
                 })
             
+            self.addresses = [channel['address'] for channel in self.channels]
+            self.amp_right = np.array([channel['amp_right'] for channel in self.channels], dtype=np.float32)
+            self.amp_left = np.array([channel['amp_left'] for channel in self.channels], dtype=np.float32)
+            
+            # Heartbeat and stop always send zeros, so that bundle is built once here;
+            # every frame shares its layout, so ramps only overwrite the float arguments
+            self.zero_dgram = build_bundle(self.addresses, [0.0] * len(self.channels)).dgram
+            self.value_slots = bundle_value_slots(self.zero_dgram)
+            
             self.log_message(f"Loaded {len(self.channels)} channels from {config_path}")
             return True
             
@@ -307,20 +414,86 @@ class MetaHumanStreamerGUI:
             messagebox.showerror("Config Error", f"Failed to load configuration:\n{e}")
             return False
     
+    def format_log_entry(self, message):
+        """Timestamp a message for the log console"""
+        # strftime only runs when the second changes; milliseconds are appended by hand
+        second, millis = divmod(time.time_ns() // 1_000_000, 1000)
+        clock = self.log_clock
+        if clock[0] != second:
+            clock = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+            self.log_clock = clock  # Swapped as one tuple, so threads never see a torn pair
+        return f"[{clock[1]}.{millis:03d}] {message}\n"
+    
     def log_message(self, message):
-        """Add message to log console"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_entry = f"[{timestamp}] {message}\n"
+        """Add message to log console (safe from any thread; shown on the next flush)"""
+        self.log_buffer.append(self.format_log_entry(message))
+    
+    def flush_log(self):
+        """Write all buffered log lines to the console with one insert"""
+        if not self.log_buffer:
+            return
+        entries = []
+        while self.log_buffer:
+            entries.append(self.log_buffer.popleft())
         
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, log_entry)
+        self.log_text.insert(tk.END, ''.join(entries))
+        # Keep the widget bounded: drop the oldest half once it gets long
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete('1.0', f"{line_count - LOG_MAX_LINES // 2}.0")
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
     
+    def drain_ui_queue(self):
+        """Apply queued worker updates on the GUI thread, then reschedule"""
+        for _ in range(UI_DRAIN_MAX):
+            try:
+                item = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind = item[0]
+            if kind == 'status':
+                self.update_status(item[1])
+            elif kind == 'connection':
+                self.update_connection_status(item[1], item[2])
+        
+        # One insert for all pending lines, one stats refresh per poll
+        self.flush_log()
+        if self.stats_dirty:
+            self.stats_dirty = False
+            self.update_osc_stats()
+        
+        self.root.after(UI_POLL_MS, self.drain_ui_queue)
+    
+    def on_timing_changed(self, *args):
+        """Parse the timing entries into typed attributes (GUI thread only)"""
+        # Half-typed values are ignored; the last valid value stays in effect
+        try:
+            fps = int(self.fps_var.get())
+            if fps > 0:
+                self.fps = fps
+                self.frame_period = 1.0 / fps
+        except ValueError:
+            pass
+        try:
+            self.duration = float(self.duration_var.get())
+        except ValueError:
+            pass
+        try:
+            self.hold = float(self.hold_var.get())
+        except ValueError:
+            pass
+    
     def update_status(self, status):
         """Update status bar"""
         self.status_var.set(f"Status: {status}")
-        self.current_mode = status
+    
+    def set_mode(self, mode):
+        """Switch the worker's mode now and show it in the status bar on the next poll"""
+        self.current_mode = mode
+        self.ui_queue.put(('status', mode))
     
     def start_worker(self):
         """Start the background worker thread"""
@@ -330,12 +503,23 @@ class MetaHumanStreamerGUI:
     
     def worker_loop(self):
         """Main worker loop that handles OSC communication"""
+        # Block on the command queue until a command arrives or the next frame is due.
+        # Frames are paced against absolute monotonic deadlines so work time does not add drift;
+        # when nothing is streaming the worker sleeps until the next command.
+        next_tick = time.monotonic()
         while self.running:
             try:
+                streaming = self.current_mode in ACTIVE_MODES
+                timeout = max(0.0, next_tick - time.monotonic()) if streaming else None
+                
                 # Process commands
                 try:
-                    command = self.command_queue.get_nowait()
+                    command = self.command_queue.get(timeout=timeout)
                     self.handle_command(command)
+                    if not streaming:
+                        # Leaving idle: the first frame goes out right away
+                        next_tick = time.monotonic()
+                    continue
                 except queue.Empty:
                     pass
                 
@@ -345,43 +529,45 @@ class MetaHumanStreamerGUI:
                 # Handle current mode
                 if self.current_mode == MODES['HEARTBEAT']:
                     self.send_heartbeat()
-                elif self.current_mode in [MODES['TURNING_RIGHT'], MODES['TURNING_LEFT'], MODES['BASELINE']]:
+                elif self.current_mode in RAMP_MODES:
                     self.send_ramp_frame()
                 
-                # Sleep for frame timing
-                fps = int(self.fps_var.get())
-                time.sleep(1.0 / fps)
+                next_tick += self.frame_period
+                if next_tick < time.monotonic():
+                    # Overloaded: resync instead of bursting to catch up
+                    next_tick = time.monotonic()
                 
             except Exception as e:
-                self.root.after(0, lambda: self.log_message(f"Worker error: {e}"))
+                self.log_message(f"Worker error: {e}")
                 time.sleep(0.1)
+                next_tick = time.monotonic()
     
     def handle_command(self, command):
         """Handle commands from the GUI thread"""
         if command == COMMANDS['START_HEARTBEAT']:
             self.start_osc_client()
-            self.root.after(0, lambda: self.update_status(MODES['HEARTBEAT']))
-            self.root.after(0, lambda: self.log_message("Started heartbeat streaming"))
+            self.set_mode(MODES['HEARTBEAT'])
+            self.log_message("Started heartbeat streaming")
             
         elif command == COMMANDS['TURN_RIGHT']:
             self.start_ramp('right')
-            self.root.after(0, lambda: self.update_status(MODES['TURNING_RIGHT']))
-            self.root.after(0, lambda: self.log_message("Started right turn"))
+            self.set_mode(MODES['TURNING_RIGHT'])
+            self.log_message("Started right turn")
             
         elif command == COMMANDS['TURN_LEFT']:
             self.start_ramp('left')
-            self.root.after(0, lambda: self.update_status(MODES['TURNING_LEFT']))
-            self.root.after(0, lambda: self.log_message("Started left turn"))
+            self.set_mode(MODES['TURNING_LEFT'])
+            self.log_message("Started left turn")
             
         elif command == COMMANDS['BASELINE']:
             self.start_ramp('baseline')
-            self.root.after(0, lambda: self.update_status(MODES['BASELINE']))
-            self.root.after(0, lambda: self.log_message("Started return to baseline"))
+            self.set_mode(MODES['BASELINE'])
+            self.log_message("Started return to baseline")
             
         elif command == COMMANDS['STOP_ALL']:
             self.stop_all()
-            self.root.after(0, lambda: self.update_status(MODES['STOPPED']))
-            self.root.after(0, lambda: self.log_message("Stopped all streaming"))
+            self.set_mode(MODES['STOPPED'])
+            self.log_message("Stopped all streaming")
             
         elif command == COMMANDS['QUIT']:
             self.running = False
@@ -392,35 +578,59 @@ class MetaHumanStreamerGUI:
             ip = self.ip_var.get()
             port = int(self.port_var.get())
             self.osc_client = SimpleUDPClient(ip, port)
+            # Larger send buffer so bursty frames don't hit back-pressure
+            sock = self.osc_client._sock
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, int(self.settings['sndbuf_bytes']))
+            sndbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+            # Fix the destination once so each frame is a plain send() with no address to resolve
+            sock.connect((ip, port))
+            self.osc_sock = sock
+            self.last_dgram = None
             self.connection_active = True
             self.last_send_time = time.time()
             self.osc_send_count = 0
             self.osc_error_count = 0
-            self.root.after(0, lambda: self.update_connection_status("Connected", "green"))
-            self.log_message(f"OSC client connected to {ip}:{port}")
+            self.ui_queue.put(('connection', "Connected", "green"))
+            self.log_message(f"OSC client connected to {ip}:{port} (send buffer {sndbuf} bytes)")
         except Exception as e:
             self.connection_active = False
-            self.root.after(0, lambda: self.update_connection_status("Connection Failed", "red"))
+            self.ui_queue.put(('connection', "Connection Failed", "red"))
             self.log_message(f"Failed to create OSC client: {e}")
     
+    def send_dgram(self, dgram, force=False):
+        """Send one encoded frame on the connected OSC socket; returns False if skipped"""
+        now = time.monotonic()
+        # Heartbeat and hold repeat the same frame: only resend it as a keepalive
+        if not force and dgram == self.last_dgram and now - self.last_dgram_time < KEEPALIVE_INTERVAL:
+            return False
+        
+        try:
+            self.osc_sock.send(dgram)
+        except ConnectionRefusedError:
+            # ICMP port-unreachable from an earlier frame: nothing is listening yet
+            pass
+        # A copy: ramp frames are slices of ramp_bytes, which the next ramp rewrites
+        self.last_dgram = bytes(dgram)
+        self.last_dgram_time = now
+        return True
+    
     def send_heartbeat(self):
         """Send heartbeat (zeros) to all channels"""
         if not self.osc_client or not self.channels:
             return
             
         success_count = 0
-        for channel in self.channels:
-            try:
-                self.osc_client.send_message(channel['address'], 0.0)
-                success_count += 1
-            except Exception as e:
-                self.osc_error_count += 1
-                self.root.after(0, lambda: self.log_message(f"OSC send error: {e}"))
+        try:
+            if self.send_dgram(self.zero_dgram):
+                success_count = len(self.channels)
+        except Exception as e:
+            self.osc_error_count += 1
+            self.log_message(f"OSC send error: {e}")
         
         if success_count > 0:
             self.osc_send_count += success_count
             self.last_send_time = time.time()
-            self.root.after(0, lambda: self.update_osc_stats())
+            self.stats_dirty = True
     
     def start_ramp(self, direction):
         """Start a ramp animation"""
@@ -428,114 +638,119 @@ class MetaHumanStreamerGUI:
             return
         
         try:
-            duration = float(self.duration_var.get())
-            fps = int(self.fps_var.get())
-            hold = float(self.hold_var.get())
+            ramp_frames = int(self.duration * self.fps)
+            hold_frames = int(self.hold * self.fps)
             
-            ramp_frames = int(duration * fps)
-            hold_frames = int(hold * fps)
+            # Per-channel amplitudes for this direction (baseline ramps to zero)
+            if direction == 'right':
+                amps = self.amp_right
+            elif direction == 'left':
+                amps = self.amp_left
+            else:  # baseline
+                amps = np.zeros_like(self.amp_right)
             
-            # Build ramp data
-            self.ramp_data = []
-            for channel in self.channels:
-                if direction == 'right':
-                    amplitude = channel['amp_right']
-                elif direction == 'left':
-                    amplitude = channel['amp_left']
-                else:  # baseline
-                    amplitude = 0.0
-                
-                # Create envelope
-                envelope = self.build_envelope(ramp_frames)
-                ramp_values = amplitude * envelope
-                self.ramp_data.append(ramp_values)
+            # Build ramp data as one (n_channels, n_frames) array: each frame is a column.
+            # It is written into a buffer kept across ramps, grown only for longer ramps.
+            envelope = self.build_envelope(ramp_frames)
+            if self.ramp_values.shape[0] != len(amps) or self.ramp_values.shape[1] < ramp_frames:
+                self.ramp_values = np.empty((len(amps), ramp_frames), dtype=np.float32)
+            self.ramp_data = np.multiply(amps[:, None], envelope[None, :],
+                                         out=self.ramp_values[:, :ramp_frames])
+            
+            # Encode every frame up front into one buffer; the send path only hands a slice
+            # of it to the socket. Frames are copies of the zero frame with the floats written
+            # in place as big-endian words (OSC keeps every argument 4-byte aligned). Only the
+            # floats differ between ramps, so the buffer is re-tiled only when the channel
+            # layout changes or a longer ramp needs more frames.
+            n_frames = self.ramp_data.shape[1]
+            frame_len = len(self.zero_dgram)
+            if self.ramp_template is not self.zero_dgram or len(self.ramp_bytes) < n_frames * frame_len:
+                # A new buffer rather than a resize: earlier frame slices may still export it
+                self.ramp_bytes = bytearray(self.zero_dgram * n_frames)
+                self.ramp_template = self.zero_dgram
+            words = np.frombuffer(self.ramp_bytes, dtype='>f4').reshape(-1, frame_len // 4)
+            words[:n_frames, self.value_slots] = self.ramp_data.T
+            frames_view = memoryview(self.ramp_bytes)
+            self.ramp_dgrams = [frames_view[f * frame_len:(f + 1) * frame_len] for f in range(n_frames)]
             
             self.ramp_frame = 0
             self.hold_frames = hold_frames
             self.hold_frame = 0
             
         except Exception as e:
-            self.root.after(0, lambda: self.log_message(f"Error starting ramp: {e}"))
+            self.log_message(f"Error starting ramp: {e}")
     
     def send_ramp_frame(self):
         """Send current frame of ramp animation"""
-        if not self.osc_client or not self.ramp_data:
+        if not self.osc_client or self.ramp_data is None:
             return
         
         try:
             success_count = 0
             # Check if we're in hold phase
-            if self.ramp_frame >= len(self.ramp_data[0]):
+            if self.ramp_frame >= len(self.ramp_dgrams):
                 if self.hold_frame < self.hold_frames:
                     # Send final values during hold
-                    for i, channel in enumerate(self.channels):
-                        final_value = self.ramp_data[i][-1]
-                        try:
-                            self.osc_client.send_message(channel['address'], final_value)
-                            success_count += 1
-                        except Exception as e:
-                            self.osc_error_count += 1
+                    try:
+                        if self.send_dgram(self.ramp_dgrams[-1]):
+                            success_count = len(self.channels)
+                    except Exception as e:
+                        self.osc_error_count += 1
                     self.hold_frame += 1
                 else:
                     # Hold complete, return to heartbeat
-                    self.root.after(0, lambda: self.command_queue.put(COMMANDS['START_HEARTBEAT']))
+                    self.command_queue.put(COMMANDS['START_HEARTBEAT'])
                 return
             
-            # Send current ramp frame
-            for i, channel in enumerate(self.channels):
-                value = self.ramp_data[i][self.ramp_frame]
-                try:
-                    self.osc_client.send_message(channel['address'], value)
-                    success_count += 1
-                except Exception as e:
-                    self.osc_error_count += 1
+            # Send current ramp frame as one bundle
+            try:
+                if self.send_dgram(self.ramp_dgrams[self.ramp_frame]):
+                    success_count = len(self.channels)
+            except Exception as e:
+                self.osc_error_count += 1
             
             if success_count > 0:
                 self.osc_send_count += success_count
                 self.last_send_time = time.time()
-                self.root.after(0, lambda: self.update_osc_stats())
+                self.stats_dirty = True
             
             # Log first few channels occasionally
             if self.ramp_frame % 10 == 0 and len(self.channels) > 0:
-                sample_values = [f"{self.ramp_data[i][self.ramp_frame]:.2f}" 
-                               for i in range(min(3, len(self.channels)))]
-                self.root.after(0, lambda: self.log_message(
-                    f"Frame {self.ramp_frame}: {', '.join(sample_values)}"))
+                sample_values = [f"{value:.2f}" for value in self.ramp_data[:3, self.ramp_frame].tolist()]
+                self.log_message(f"Frame {self.ramp_frame}: {', '.join(sample_values)}")
             
             self.ramp_frame += 1
             
         except Exception as e:
-            self.root.after(0, lambda: self.log_message(f"Ramp send error: {e}"))
+            self.log_message(f"Ramp send error: {e}")
     
     def stop_all(self):
         """Stop all streaming and send zeros"""
         self.ramp_data = None
+        self.ramp_dgrams = []
         self.ramp_frame = 0
         self.hold_frame = 0
         self.connection_active = False
-        self.root.after(0, lambda: self.update_connection_status("Disconnected", "red"))
+        self.ui_queue.put(('connection', "Disconnected", "red"))
         
         if self.osc_client and self.channels:
             success_count = 0
-            for channel in self.channels:
-                try:
-                    self.osc_client.send_message(channel['address'], 0.0)
-                    success_count += 1
-                except Exception as e:
-                    self.osc_error_count += 1
-                    self.root.after(0, lambda: self.log_message(f"Stop send error: {e}"))
+            try:
+                self.send_dgram(self.zero_dgram, force=True)
+                success_count = len(self.channels)
+            except Exception as e:
+                self.osc_error_count += 1
+                self.log_message(f"Stop send error: {e}")
             
             if success_count > 0:
                 self.osc_send_count += success_count
                 self.last_send_time = time.time()
-                self.root.after(0, lambda: self.update_osc_stats())
+                self.stats_dirty = True
     
     def build_envelope(self, n_frames):
         """Build cubic ease-in-out envelope"""
-        t = np.linspace(0, 1, n_frames)
-        # Cubic ease-in-out: 3t² - 2t³
-        envelope = 3 * t**2 - 2 * t**3
-        return envelope
+        # Cached per frame count: repeated turns with the same duration/FPS reuse it
+        return ease_in_out_envelope(n_frames)
     
     def update_connection_status(self, status, color):
         """Update connection status indicator"""
@@ -553,8 +768,8 @@ class MetaHumanStreamerGUI:
             time_since_last_send = time.time() - self.last_send_time
             if time_since_last_send > self.connection_timeout:
                 self.connection_active = False
-                self.root.after(0, lambda: self.update_connection_status("Timeout", "orange"))
-                self.root.after(0, lambda: self.log_message("Connection timeout - no recent OSC activity"))
+                self.ui_queue.put(('connection', "Timeout", "orange"))
+                self.log_message("Connection timeout - no recent OSC activity")
     
     # GUI event handlers
     def start_streaming(self):
@@ -600,8 +815,7 @@ class MetaHumanStreamerGUI:
     
     def update_button_states(self):
         """Update button enabled/disabled states"""
-        is_streaming = self.current_mode in [MODES['HEARTBEAT'], MODES['TURNING_RIGHT'], 
-                                           MODES['TURNING_LEFT'], MODES['BASELINE']]
+        is_streaming = self.current_mode in ACTIVE_MODES
         
         self.start_btn.config(state=tk.NORMAL if not is_streaming else tk.DISABLED)
         self.right_btn.config(state=tk.NORMAL if is_streaming else tk.DISABLED)
@@ -611,6 +825,9 @@ class MetaHumanStreamerGUI:
     
     def on_closing(self):
         """Handle window closing"""
+        if self.save_after_id is not None:
+            self.root.after_cancel(self.save_after_id)
+            self.save_after_id = None
         self.save_settings()
         self.command_queue.put(COMMANDS['QUIT'])
         self.running = False
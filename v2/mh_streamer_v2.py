@@ -11,36 +11,183 @@ import queue
 import time
 import json
 import numpy as np
-import torch
-import torch.nn as nn
 from pythonosc import udp_client
+import ctypes
+import ctypes.util
+import errno
+import functools
+import platform
+import socket
+import struct
 import os
 import sys
-from datetime import datetime
+
+from osc_bundles import build_bundle_template, frame_datagrams, osc_message, write_bundle_values
 
 # Configuration
 OSC_HOST = "127.0.0.1"
 OSC_PORT = 7000
 FPS = 30
 OUT_FRAMES = 60
+OSC_SNDBUF_BYTES = 4 * 1024 * 1024  # Room for a full frame burst without blocking
+IPTOS_LOWDELAY = 0x10
+SEND_QUEUE_FRAMES = 2  # Frames waiting for the sender thread; the oldest is dropped when full
+STATS_UPDATE_INTERVAL = 0.5  # Seconds between refreshes of the stats label while streaming
+LOG_FLUSH_MS = 200  # Interval at which queued log lines are written to the console
+
+# sendmmsg(2) lets a whole frame of datagrams go out in one syscall (Linux only)
+_libc = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _libc.sendmmsg
+    except (OSError, AttributeError):
+        _libc = None
+
+# UDP GSO: the kernel splits one buffer of equal-size segments into datagrams (Linux >= 4.18)
+UDP_SEGMENT = getattr(socket, "UDP_SEGMENT", 103)
+UDP_GSO_MAX_SEGMENTS = 64
+
+def _kernel_supports_udp_gso():
+    """Check whether the running kernel is new enough for UDP_SEGMENT"""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split(".")[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (4, 18)
+
+_udp_gso = _kernel_supports_udp_gso()
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p), ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.POINTER(_IOVec)), ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p), ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [("sin_family", ctypes.c_ushort), ("sin_port", ctypes.c_uint16),
+                ("sin_addr", ctypes.c_ubyte * 4), ("sin_zero", ctypes.c_ubyte * 8)]
+
+@functools.lru_cache(maxsize=8)
+def _sockaddr_in(host, port):
+    """Build a sockaddr_in for a dotted-quad host, or None if it is not one"""
+    try:
+        packed = socket.inet_aton(host)
+    except OSError:
+        return None
+    addr = _SockAddrIn()
+    addr.sin_family = socket.AF_INET
+    addr.sin_port = socket.htons(port)
+    addr.sin_addr[:] = packed
+    return addr
 
-class MovementGRU(nn.Module):
-    """GRU model for generating movement sequences"""
-    def __init__(self, input_size, hidden_size=128, output_size=None):
-        super().__init__()
-        if output_size is None:
-            output_size = input_size
-        self.hidden_size = hidden_size
-        self.gru = nn.GRU(input_size, hidden_size, batch_first=True, num_layers=2)
-        self.output_layer = nn.Linear(hidden_size, output_size)
-        self.dropout = nn.Dropout(0.2)
-        
-    def forward(self, x):
-        # x shape: (batch, seq_len, input_dim)
-        gru_out, _ = self.gru(x)
-        gru_out = self.dropout(gru_out)
-        output = self.output_layer(gru_out)
-        return output
+def tune_send_socket(sock, sndbuf_bytes=OSC_SNDBUF_BYTES):
+    """Enlarge the UDP send buffer and mark outgoing packets as low-delay"""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf_bytes)
+    if sock.family == socket.AF_INET and hasattr(socket, "IP_TOS"):
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, IPTOS_LOWDELAY)
+    # The kernel may cap the request at net.core.wmem_max
+    return sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+
+def send_frame(sock, packets, address=None):
+    """Send a frame of OSC datagrams with as few syscalls as the platform allows
+    
+    Runs of adjacent equal-length datagrams are coalesced into one UDP_SEGMENT
+    (GSO) send each; the others go out through send_batch(). Datagrams leave in
+    list order, so a return value of n means packets[:n] were sent. Pass
+    address=None when the socket is already connect()ed to its destination.
+    """
+    global _udp_gso
+    # A bundled frame is usually a single datagram: one plain send, no batch setup
+    if len(packets) == 1:
+        if address is None:
+            sock.send(packets[0])
+        else:
+            sock.sendto(packets[0], address)
+        return 1
+    if not (_udp_gso and sock.family == socket.AF_INET):
+        return send_batch(sock, packets, address)
+    
+    sent = 0
+    pending = []  # Datagrams for send_batch(), flushed before the next GSO run
+    start = 0
+    while start < len(packets):
+        size = len(packets[start])
+        end = start + 1
+        while (end < len(packets) and end - start < UDP_GSO_MAX_SEGMENTS
+               and len(packets[end]) == size):
+            end += 1
+        run = packets[start:end]
+        start = end
+        if len(run) < 2 or not _udp_gso:
+            pending.extend(run)
+            continue
+        
+        sent += send_batch(sock, pending, address)
+        pending = []
+        try:
+            sock.sendmsg([b"".join(run)],
+                         [(socket.IPPROTO_UDP, UDP_SEGMENT, struct.pack("H", size))],
+                         0, *((address,) if address is not None else ()))
+            sent += len(run)
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.EIO, errno.ENOPROTOOPT, errno.EOPNOTSUPP):
+                raise
+            # Route or device without GSO support; stop trying it
+            _udp_gso = False
+            pending.extend(run)
+    
+    return sent + send_batch(sock, pending, address)
+
+def send_batch(sock, packets, address=None):
+    """Send datagrams in one sendmmsg() call, or send()/sendto() each as a fallback"""
+    if not packets:
+        return 0
+    sockaddr = None
+    use_mmsg = _libc is not None
+    if use_mmsg and address is not None:
+        if sock.family == socket.AF_INET:
+            sockaddr = _sockaddr_in(*address)
+        use_mmsg = sockaddr is not None
+    if not use_mmsg:
+        for packet in packets:
+            if address is None:
+                sock.send(packet)
+            else:
+                sock.sendto(packet, address)
+        return len(packets)
+    
+    count = len(packets)
+    iovs = (_IOVec * count)()
+    msgs = (_MMsgHdr * count)()
+    for i, packet in enumerate(packets):
+        iovs[i].iov_base = ctypes.cast(ctypes.c_char_p(packet), ctypes.c_void_p).value
+        iovs[i].iov_len = len(packet)
+        hdr = msgs[i].msg_hdr
+        if sockaddr is not None:
+            hdr.msg_name = ctypes.addressof(sockaddr)
+            hdr.msg_namelen = ctypes.sizeof(sockaddr)
+        hdr.msg_iov = ctypes.pointer(iovs[i])
+        hdr.msg_iovlen = 1
+    
+    # sendmmsg may stop short of the full batch; resubmit the remainder
+    sent = 0
+    while sent < count:
+        n = _libc.sendmmsg(sock.fileno(), ctypes.byref(msgs, sent * ctypes.sizeof(_MMsgHdr)),
+                           count - sent, 0)
+        if n < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        sent += n
+    return sent
 
 class MetaHumanStreamerV2:
     def __init__(self):
@@ -55,27 +202,35 @@ class MetaHumanStreamerV2:
         
         # Data storage
         self.baseline_vector = None
-        self.baseline_model = None
-        self.left_turn_model = None
-        self.right_turn_model = None
         self.feature_names = None
         self.normalization_params = None
+        self.norm_mean = None  # normalization_params['mean'] / ['std'] as arrays
+        self.norm_std = None
         
         # OSC channel configuration
         self.channels = []
         self.channel_mapping = {}  # Maps source columns to feature indices
+        self.frame_transform = None  # Vectorized channel transforms, see build_frame_transform()
         
         # Streaming state
         self.is_streaming = False
         self.current_mode = "BASELINE"  # BASELINE, TURNING_LEFT, TURNING_RIGHT
         self.stream_thread = None
         self.stop_event = threading.Event()
+        # Plain copy of the FPS entry for the worker threads, which must not read Tk
+        # variables; see update_timing_settings()
+        self.frame_duration = 1.0 / FPS
+        self.send_thread = None  # Sends the frames stream_worker() builds, see send_worker()
         
         # Logging and stats
         self.osc_send_count = 0
         self.osc_error_count = 0
+        self.dropped_frame_count = 0
         self.last_send_time = 0
+        self.last_stats_update = 0  # time.monotonic() of the last stats label refresh
         self.show_data = True  # Toggle for showing data in log
+        self.log_queue = queue.SimpleQueue()  # Log lines waiting for flush_log()
+        self.log_clock = (0, "")  # (second, formatted HH:MM:SS) for log timestamps
         
         # Movement data
         self.baseline_sequence = None
@@ -84,8 +239,9 @@ class MetaHumanStreamerV2:
         
         # GUI setup
         self.setup_gui()
+        self.flush_log()
         
-        # Load models and data
+        # Load normalization parameters and movement data
         self.load_models_and_data()
         
         # Load channel configuration
@@ -181,6 +337,9 @@ class MetaHumanStreamerV2:
         fps_entry = ttk.Entry(settings_frame, textvariable=self.fps_var, width=10)
         fps_entry.grid(row=3, column=1, padx=(10, 0), pady=(5, 0))
         
+        fps_entry.bind("<Return>", self.update_timing_settings)
+        fps_entry.bind("<FocusOut>", self.update_timing_settings)
+        
         # Log console
         log_frame = ttk.LabelFrame(main_frame, text="Log Console", padding="5")
         log_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
@@ -224,7 +383,7 @@ class MetaHumanStreamerV2:
 • Continuously streams baseline position
 • Overlays turn movements on specific bones
 • Smooth transitions between movements
-• Separate models for each movement type
+• Separate recorded sequences for each movement type
 • Configurable OSC host and port settings
 • Real-time OSC connection management
 • Live data logging and debugging"""
@@ -233,13 +392,22 @@ class MetaHumanStreamerV2:
         info_label.grid(row=0, column=0, sticky=tk.W)
         
     def load_models_and_data(self):
-        """Load the trained models and data"""
+        """Load the normalization parameters and movement data
+        
+        Streaming plays the preprocessed sequences directly, so the GRU checkpoints
+        written by preprocessing_v2 are not loaded.
+        """
         try:
             data_dir = "data/processed_v2"
             
             # Load normalization parameters
             with open(os.path.join(data_dir, "normalization_params.json"), 'r') as f:
                 self.normalization_params = json.load(f)
+            # Converted once here rather than on every frame; the stats were computed in
+            # float32, so float32 holds them exactly
+            self.norm_mean = np.asarray(self.normalization_params['mean'], dtype=np.float32)
+            self.norm_std = np.asarray(self.normalization_params['std'], dtype=np.float32)
+            self.frame_transform = None  # Built with the stats folded in
             
             # Load baseline vector
             self.baseline_vector = np.load(os.path.join(data_dir, "baseline_vector.npy"))
@@ -253,38 +421,23 @@ class MetaHumanStreamerV2:
                 # Generate feature names if not available
                 self.feature_names = [f"feature_{i}" for i in range(len(self.baseline_vector))]
             
-            # Load models
-            input_size = len(self.baseline_vector)
-            
-            # Baseline model
-            self.baseline_model = MovementGRU(input_size, hidden_size=128)
-            self.baseline_model.load_state_dict(torch.load(os.path.join(data_dir, "baseline_gru.pth")))
-            self.baseline_model.eval()
-            
-            # Left turn model
-            self.left_turn_model = MovementGRU(input_size, hidden_size=128)
-            self.left_turn_model.load_state_dict(torch.load(os.path.join(data_dir, "left_turn_gru.pth")))
-            self.left_turn_model.eval()
-            
-            # Right turn model
-            self.right_turn_model = MovementGRU(input_size, hidden_size=128)
-            self.right_turn_model.load_state_dict(torch.load(os.path.join(data_dir, "right_turn_gru.pth")))
-            self.right_turn_model.eval()
-            
             # Generate baseline sequence
             self.generate_baseline_sequence()
             
-            self.status_label.config(text="Models loaded successfully")
-            self.log_message("Models and data loaded successfully")
-            print("Models and data loaded successfully")
+            # Turn sequences are loaded once here rather than on every button press
+            self.load_turn_sequences()
+            
+            self.status_label.config(text="Data loaded successfully")
+            self.log_message("Data loaded successfully")
+            print("Data loaded successfully")
             
             # Initialize OSC client
             self.update_osc_client()
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load models: {str(e)}")
-            self.status_label.config(text="Error loading models")
-            print(f"Error loading models: {e}")
+            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
+            self.status_label.config(text="Error loading data")
+            print(f"Error loading data: {e}")
     
     def load_channel_config(self):
         """Load OSC channel configuration for Unreal Engine"""
@@ -307,19 +460,28 @@ class MetaHumanStreamerV2:
                     'transform': channel['transform']
                 })
             
-            # Create mapping from source columns to feature indices
+            # Create mapping from source columns to feature indices; one dict pass over the
+            # feature names instead of a list.index() scan per channel (the first occurrence
+            # wins, as with index())
+            name_to_idx = {}
+            for idx, name in enumerate(self.feature_names or ()):
+                name_to_idx.setdefault(name, idx)
+            
             self.channel_mapping = {}
             for channel in self.channels:
                 source_column = channel['source_column']
                 
                 # Find this feature in our feature names
                 if self.feature_names:
-                    try:
-                        feature_idx = self.feature_names.index(source_column)
+                    feature_idx = name_to_idx.get(source_column)
+                    if feature_idx is not None:
                         self.channel_mapping[source_column] = feature_idx
-                    except ValueError:
+                    else:
                         self.log_message(f"Warning: Feature {source_column} not found in data")
             
+            # Rebuilt for the new channels on the next frame
+            self.frame_transform = None
+            
             self.log_message(f"Loaded {len(self.channels)} OSC channels from {config_path}")
             self.log_message(f"Mapped {len(self.channel_mapping)} channels to features")
             return True
@@ -328,27 +490,95 @@ class MetaHumanStreamerV2:
             self.log_message(f"Error loading OSC channel config: {e}")
             return False
     
+    def build_frame_transform(self, n_features):
+        """Gather the channel transforms into arrays for frames of n_features values
+        
+        Every frame then transforms all mapped channels in one vectorized pass.
+        Denormalization is folded in: scale * (x * std + mean) + offset is applied
+        as (scale * std) * x + (scale * mean + offset), so normalized frames are
+        transformed directly.
+        
+        The channel bundles are prebuilt here too (see build_bundle_template()).
+        Unmapped channels keep sending zero; channels mapped past the end of the
+        frame are left out.
+        """
+        addresses = []
+        value_messages = []  # Message index of each mapped channel
+        feature_idx = []
+        scales = []
+        offsets = []
+        clamp_min = []
+        clamp_max = []
+        
+        for channel in self.channels:
+            idx = self.channel_mapping.get(channel['source_column'])
+            if idx is not None:
+                if idx >= n_features:
+                    continue
+                transform = channel['transform']
+                clamp = transform['clamp'] if transform['clamp'] is not None else (-np.inf, np.inf)
+                value_messages.append(len(addresses))
+                feature_idx.append(idx)
+                scales.append(transform['scale'])
+                offsets.append(transform['offset'])
+                clamp_min.append(clamp[0])
+                clamp_max.append(clamp[1])
+            addresses.append(channel['osc_address'])
+        
+        bundles, value_slots = build_bundle_template(addresses, value_messages)
+        
+        feature_idx = np.array(feature_idx, dtype=np.intp)
+        scales = np.array(scales, dtype=np.float64)
+        offsets = np.array(offsets, dtype=np.float64)
+        if self.norm_mean is not None:
+            offsets += scales * self.norm_mean[feature_idx]
+            scales *= self.norm_std[feature_idx]
+        
+        # float32 throughout, like the sequences, so no step of the per-frame arithmetic
+        # upcasts to float64
+        clamp_min = np.array(clamp_min, dtype=np.float32)
+        clamp_max = np.array(clamp_max, dtype=np.float32)
+        self.frame_transform = {
+            'n_features': n_features,
+            'bundles': bundles,
+            'value_slots': value_slots,
+            'feature_idx': feature_idx,
+            'scales': scales.astype(np.float32),
+            'offsets': offsets.astype(np.float32),
+            'clamp_min': clamp_min,
+            'clamp_max': clamp_max,
+            'clamped': bool(np.isfinite(clamp_min).any() or np.isfinite(clamp_max).any()),
+            # Per-frame work buffers, so a frame allocates no arrays
+            'gathered': np.empty(len(feature_idx), dtype=np.float32),
+            'values': np.empty(len(feature_idx), dtype=np.float32)
+        }
+        return self.frame_transform
+    
     def generate_baseline_sequence(self):
         """Generate a baseline sequence for continuous streaming"""
-        with torch.no_grad():
-            # Load baseline data and use it directly
-            baseline_data = np.load("data/processed_v2/baseline_data.npy")
-            # Use the first sample as our baseline sequence
-            self.baseline_sequence = baseline_data[0]  # Shape: (60, 864)
-            print(f"Loaded baseline sequence: {self.baseline_sequence.shape}")
+        # Load baseline data and use it directly
+        baseline_data = np.load("data/processed_v2/baseline_data.npy")
+        # Use the first sample as our baseline sequence, as float32 (what OSC sends)
+        self.baseline_sequence = baseline_data[0].astype(np.float32)  # Shape: (60, 864)
+        print(f"Loaded baseline sequence: {self.baseline_sequence.shape}")
     
-    def generate_turn_sequence(self, model, duration_seconds):
-        """Generate a turn sequence using the specified model"""
-        with torch.no_grad():
-            # Load the appropriate turn data
-            if model == self.left_turn_model:
-                turn_data = np.load("data/processed_v2/left_turn_data.npy")
-            else:
-                turn_data = np.load("data/processed_v2/right_turn_data.npy")
-            
-            # Use the first sample as our turn sequence
-            sequence = turn_data[0]  # Shape: (60, 864)
-            return sequence
+    def load_turn_sequences(self):
+        """Load the left and right turn sequences used while turning
+        
+        A sequence that cannot be loaded stays None, and that turn streams the
+        baseline instead.
+        """
+        # Use the first sample of each as our turn sequence, copied out as float32 so
+        # the rest of the samples are not kept in memory
+        for direction in ("left", "right"):
+            try:
+                sequence = np.load(f"data/processed_v2/{direction}_turn_data.npy")[0].astype(np.float32)  # Shape: (60, 864)
+            except Exception as e:
+                sequence = None
+                self.log_message(f"Could not load {direction} turn sequence: {e}")
+            setattr(self, f"{direction}_turn_sequence", sequence)
+        print(f"Loaded turn sequences: left {getattr(self.left_turn_sequence, 'shape', None)}, "
+              f"right {getattr(self.right_turn_sequence, 'shape', None)}")
     
     def update_osc_client(self):
         """Update OSC client with current host and port settings"""
@@ -356,14 +586,36 @@ class MetaHumanStreamerV2:
             self.osc_host = self.host_var.get()
             self.osc_port = int(self.port_var.get())
             self.osc_client = udp_client.SimpleUDPClient(self.osc_host, self.osc_port)
+            sndbuf = tune_send_socket(self.osc_client._sock)
+            # Fixed destination: connect once so the kernel caches the route
+            self.osc_client._sock.connect((self.osc_host, self.osc_port))
             self.conn_label.config(text=f"OSC: {self.osc_host}:{self.osc_port}")
-            self.log_message(f"OSC client connected to {self.osc_host}:{self.osc_port}")
+            self.log_message(f"OSC client connected to {self.osc_host}:{self.osc_port} (send buffer {sndbuf} bytes)")
             print(f"OSC client updated: {self.osc_host}:{self.osc_port}")
         except ValueError:
             messagebox.showerror("Error", "Invalid port number. Please enter a valid integer.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update OSC client: {str(e)}")
     
+    def update_timing_settings(self, event=None):
+        """Copy the FPS entry into frame_duration
+        
+        Runs on the Tk thread (entry <Return>/<FocusOut> and stream start), so the
+        worker threads only ever read a plain attribute. Returns False, keeping the
+        previous value, if the entry is invalid.
+        """
+        try:
+            fps = int(self.fps_var.get())
+        except ValueError:
+            fps = 0
+        if fps <= 0:
+            if event is not None:
+                self.log_message("Invalid FPS; keeping the previous setting")
+            return False
+        
+        self.frame_duration = 1.0 / fps
+        return True
+    
     def apply_osc_settings(self):
         """Apply OSC settings and update connection"""
         if self.is_streaming:
@@ -376,18 +628,32 @@ class MetaHumanStreamerV2:
             self.log_message(f"OSC settings updated to {self.osc_host}:{self.osc_port}")
     
     def log_message(self, message):
-        """Add message to log console"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_entry = f"[{timestamp}] {message}\n"
+        """Add message to log console (safe to call from any thread)"""
+        now = time.time()
+        second = int(now)
+        # strftime only when the second changes; the milliseconds are formatted directly
+        if second != self.log_clock[0]:
+            self.log_clock = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+        
+        # Queued for the main thread, which writes them in batches in flush_log()
+        self.log_queue.put(f"[{self.log_clock[1]}.{int((now - second) * 1000):03d}] {message}\n")
+    
+    def flush_log(self):
+        """Write queued log lines to the console in one insert, then reschedule"""
+        entries = []
+        while True:
+            try:
+                entries.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                break
         
-        def update_log():
+        if entries:
             self.log_text.config(state=tk.NORMAL)
-            self.log_text.insert(tk.END, log_entry)
+            self.log_text.insert(tk.END, "".join(entries))
             self.log_text.see(tk.END)
             self.log_text.config(state=tk.DISABLED)
         
-        # Update from main thread
-        self.root.after(0, update_log)
+        self.root.after(LOG_FLUSH_MS, self.flush_log)
     
     def toggle_data_display(self):
         """Toggle data display in log"""
@@ -403,7 +669,8 @@ class MetaHumanStreamerV2:
     
     def update_osc_stats(self):
         """Update OSC statistics display"""
-        self.osc_stats_var.set(f"Messages: {self.osc_send_count} | Errors: {self.osc_error_count}")
+        self.osc_stats_var.set(f"Messages: {self.osc_send_count} | Errors: {self.osc_error_count}"
+                               f" | Dropped frames: {self.dropped_frame_count}")
     
     def start_left_turn(self):
         """Start left turn movement"""
@@ -411,10 +678,6 @@ class MetaHumanStreamerV2:
             return
             
         self.current_mode = "TURNING_LEFT"
-        duration = float(self.duration_var.get())
-        
-        # Generate left turn sequence
-        self.left_turn_sequence = self.generate_turn_sequence(self.left_turn_model, duration)
         
         self.status_label.config(text="Turning Left...")
         self.log_message("Started left turn")
@@ -426,10 +689,6 @@ class MetaHumanStreamerV2:
             return
             
         self.current_mode = "TURNING_RIGHT"
-        duration = float(self.duration_var.get())
-        
-        # Generate right turn sequence
-        self.right_turn_sequence = self.generate_turn_sequence(self.right_turn_model, duration)
         
         self.status_label.config(text="Turning Right...")
         self.log_message("Started right turn")
@@ -462,8 +721,12 @@ class MetaHumanStreamerV2:
             messagebox.showerror("Error", "OSC client not initialized. Please check your OSC settings.")
             return
         
+        # Picks up an edit that has not been confirmed with Return or by leaving the entry
+        if not self.update_timing_settings():
+            messagebox.showerror("Error", "Invalid FPS. Please enter a positive whole number.")
+            return
+        
         self.is_streaming = True
-        self.stop_event.clear()
         
         # Update GUI
         self.stream_button.config(text="Stop Streaming")
@@ -471,8 +734,17 @@ class MetaHumanStreamerV2:
         self.right_button.config(state="normal")
         self.baseline_button.config(state="normal")
         
-        # Start streaming thread
-        self.stream_thread = threading.Thread(target=self.stream_worker)
+        # Start the sender thread, then the streaming thread that feeds it. Each run gets
+        # its own queue and stop event, so threads of a run that is still winding down
+        # never touch the new one
+        self.stop_event = threading.Event()
+        send_queue = queue.Queue(maxsize=SEND_QUEUE_FRAMES)
+        self.send_thread = threading.Thread(target=self.send_worker, args=(send_queue,))
+        self.send_thread.daemon = True
+        self.send_thread.start()
+        
+        self.stream_thread = threading.Thread(target=self.stream_worker,
+                                              args=(send_queue, self.stop_event))
         self.stream_thread.daemon = True
         self.stream_thread.start()
         
@@ -495,13 +767,14 @@ class MetaHumanStreamerV2:
         self.log_message("Stopped streaming")
         print("Stopped streaming")
     
-    def stream_worker(self):
-        """Background worker for streaming data"""
-        frame_duration = 1.0 / int(self.fps_var.get())
+    def stream_worker(self, send_queue, stop_event):
+        """Background worker for streaming data into send_queue until stop_event is set"""
         frame_count = 0
+        next_tick = time.perf_counter()
         
-        while not self.stop_event.is_set():
-            start_time = time.time()
+        while not stop_event.is_set():
+            # Re-read every frame so an FPS change applies while streaming
+            frame_duration = self.frame_duration
             
             # Get current sequence based on mode
             if self.current_mode == "TURNING_LEFT" and self.left_turn_sequence is not None:
@@ -514,16 +787,76 @@ class MetaHumanStreamerV2:
             # Stream current frame
             if sequence is not None:
                 frame_idx = frame_count % len(sequence)
-                self.stream_frame(sequence[frame_idx], frame_count)
+                self.stream_frame(sequence[frame_idx], frame_count, send_queue)
                 frame_count += 1
             
-            # Maintain FPS
-            elapsed = time.time() - start_time
-            sleep_time = max(0, frame_duration - elapsed)
-            time.sleep(sleep_time)
+            # Maintain FPS against absolute deadlines so timing does not drift; after a
+            # stall longer than a frame, resync instead of sending a burst to catch up.
+            # Waiting on the stop event lets stop_streaming() cut the wait short
+            next_tick += frame_duration
+            delay = next_tick - time.perf_counter()
+            if delay < -frame_duration:
+                next_tick = time.perf_counter()
+            stop_event.wait(max(0.0, delay))
+        
+        # Let the sender finish what is queued, then exit
+        self.queue_frame(send_queue, None)
+    
+    def queue_frame(self, send_queue, item):
+        """Hand a built frame to the sender thread, dropping the oldest queued one if
+        the sender has fallen behind (a stale frame is worth less than a late one)"""
+        try:
+            send_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                send_queue.get_nowait()
+                self.dropped_frame_count += 1
+            except queue.Empty:
+                pass
+            # The run's streaming thread is the only producer, so there is room now
+            send_queue.put_nowait(item)
+    
+    def send_worker(self, send_queue):
+        """Background worker that sends the frames stream_frame() puts on send_queue
+        
+        Socket writes happen here so that a slow send never pushes the streaming
+        thread past its next frame deadline. A None item stops the worker.
+        """
+        while True:
+            item = send_queue.get()
+            if item is None:
+                # Show the final counts
+                self.root.after(0, self.update_osc_stats)
+                break
+            frame_count, bundles = item
+            
+            success_count = 0
+            try:
+                sent = send_frame(self.osc_client._sock, [dgram for dgram, _ in bundles])
+                success_count = sum(count for _, count in bundles[:sent])
+            except ConnectionRefusedError:
+                # ICMP port-unreachable from an earlier frame: nothing is listening yet
+                pass
+            except Exception as e:
+                self.osc_error_count += 1
+                self.log_message(f"OSC send error for frame {frame_count}: {e}")
+            
+            # Update stats
+            self.osc_send_count += success_count
+            self.last_send_time = time.time()
+            
+            # Update stats display a couple of times a second rather than every frame, so
+            # the Tk event loop is not flooded with label updates
+            now = time.monotonic()
+            if now - self.last_stats_update >= STATS_UPDATE_INTERVAL:
+                self.last_stats_update = now
+                self.root.after(0, self.update_osc_stats)
     
-    def stream_frame(self, frame_data, frame_count):
-        """Stream a single frame of data via OSC using proper Unreal format"""
+    def stream_frame(self, frame_data, frame_count, send_queue):
+        """Stream a single frame of data via OSC using proper Unreal format
+        
+        The built datagrams go on send_queue for the sender thread.
+        """
         try:
             if self.osc_client is None:
                 self.log_message("OSC client not available")
@@ -533,65 +866,32 @@ class MetaHumanStreamerV2:
                 self.log_message("No channels configured")
                 return
                 
-            # Denormalize the data
-            denormalized_data = self.denormalize_data(frame_data)
-            
-            # Send data to configured OSC channels
-            success_count = 0
-            sample_values = []
-            
-            for channel in self.channels:
-                source_column = channel['source_column']
-                osc_address = channel['osc_address']
-                transform = channel['transform']
-                
-                # Get the feature value for this channel
-                if source_column in self.channel_mapping:
-                    feature_idx = self.channel_mapping[source_column]
-                    if feature_idx < len(denormalized_data):
-                        # Get raw value from data
-                        raw_value = denormalized_data[feature_idx]
-                        
-                        # Apply transform: scale * value + offset
-                        transformed_value = transform['scale'] * raw_value + transform['offset']
-                        
-                        # Apply clamping if specified
-                        if transform['clamp'] is not None:
-                            clamp_min, clamp_max = transform['clamp']
-                            transformed_value = max(clamp_min, min(clamp_max, transformed_value))
-                        
-                        try:
-                            # Send OSC message with proper address format
-                            self.osc_client.send_message(osc_address, float(transformed_value))
-                            success_count += 1
-                            sample_values.append(f"{transformed_value:.3f}")
-                        except Exception as e:
-                            self.osc_error_count += 1
-                            self.log_message(f"OSC send error for {osc_address}: {e}")
-                else:
-                    # Send zero if feature not found
-                    try:
-                        self.osc_client.send_message(osc_address, 0.0)
-                        success_count += 1
-                    except Exception as e:
-                        self.osc_error_count += 1
-                        self.log_message(f"OSC send error for {osc_address}: {e}")
+            transform = self.frame_transform
+            if transform is None or transform['n_features'] != len(frame_data):
+                transform = self.build_frame_transform(len(frame_data))
             
-            # Send frame info (optional control messages)
-            try:
-                self.osc_client.send_message("/mh/frame", frame_count)
-                self.osc_client.send_message("/mh/mode", self.current_mode)
-                success_count += 2
-            except Exception as e:
-                self.osc_error_count += 1
-                self.log_message(f"OSC send error for control messages: {e}")
+            # Denormalize and apply transforms to all mapped channels at once (the fused
+            # scale * value + offset), then clamp, all in place in the transform's buffers.
+            # The indices are known to be in range, so take() can skip its bounds buffering
+            gathered = transform['gathered']
+            values = transform['values']
+            np.take(frame_data, transform['feature_idx'], out=gathered, mode='clip')
+            np.multiply(gathered, transform['scales'], out=values)
+            np.add(values, transform['offsets'], out=values)
+            if transform['clamped']:
+                np.clip(values, transform['clamp_min'], transform['clamp_max'], out=values)
+            sample_values = [f"{value:.3f}" for value in values[:5]]
             
-            # Update stats
-            self.osc_send_count += success_count
-            self.last_send_time = time.time()
+            # Store the values into the prebuilt channel bundles and add the frame info
+            # (optional control messages). The sender thread gets copies, since the next
+            # frame rewrites the template
+            write_bundle_values(transform['value_slots'], values)
+            control = [osc_message("/mh/frame", frame_count), osc_message("/mh/mode", self.current_mode)]
+            dgrams = frame_datagrams(transform['bundles'], control, copy=True)
             
-            # Update stats display
-            self.root.after(0, self.update_osc_stats)
+            # The whole frame goes out at once, as OSC bundles: one datagram unless it outgrows
+            # the MTU. The sender thread does the socket write
+            self.queue_frame(send_queue, (frame_count, dgrams))
             
             # Log data if enabled (every 10th frame to avoid spam)
             if self.show_data and frame_count % 10 == 0:
@@ -602,18 +902,6 @@ class MetaHumanStreamerV2:
             self.log_message(f"Error streaming frame: {e}")
             print(f"Error streaming frame: {e}")
     
-    def denormalize_data(self, normalized_data):
-        """Denormalize data using the stored parameters"""
-        if self.normalization_params is None:
-            return normalized_data
-        
-        mean = np.array(self.normalization_params['mean'])
-        std = np.array(self.normalization_params['std'])
-        
-        # Denormalize: x = (x_norm * std) + mean
-        denormalized = (normalized_data * std) + mean
-        return denormalized
-    
     def run(self):
         """Start the GUI application"""
         self.root.mainloop()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+OSC bundle encoding shared by the v2 and v3 streamers
+
+A frame's channel messages have the same addresses and sizes every frame, so
+their bundles are laid out once as a template; each frame then only stores its
+float values into the template and appends the control messages.
+"""
+
+import struct
+import numpy as np
+from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
+
+MAX_DATAGRAM_BYTES = 1400  # Keep each bundle under a typical Ethernet MTU (no IP fragmentation)
+
+# Compiled once instead of parsing the format string on every call
+_PACK_F = struct.Struct(">f").pack
+_PACK_I = struct.Struct(">i").pack
+
+BUNDLE_HEADER = OscBundleBuilder(IMMEDIATELY).build().dgram
+
+def osc_float_prefix(address):
+    """OSC address + ',f' type tag, each null-padded to a 4-byte boundary;
+    a float message is this prefix followed by the 4-byte value"""
+    padded = address.encode() + b"\0"
+    padded += b"\0" * (-len(padded) % 4)
+    return padded + b",f\0\0"
+
+def osc_message(address, value):
+    """Encode a single-argument OSC message of any type pythonosc supports"""
+    builder = OscMessageBuilder(address=address)
+    builder.add_arg(value)
+    return builder.build().dgram
+
+def build_frame_bundles(messages, max_bytes=MAX_DATAGRAM_BYTES):
+    """Pack one frame's encoded OSC messages into as few bundles as fit;
+    returns (datagram, message_count) pairs"""
+    dgrams = []
+    parts = None
+    bundle_size = 0
+    bundle_count = 0
+    for msg in messages:
+        element_size = 4 + len(msg)  # int32 size prefix + message
+
+        if parts is not None and bundle_size + element_size > max_bytes:
+            dgrams.append((b"".join(parts), bundle_count))
+            parts = None
+        if parts is None:
+            parts = [BUNDLE_HEADER]
+            bundle_size = len(BUNDLE_HEADER)  # '#bundle\0' + timetag
+            bundle_count = 0
+        parts.append(_PACK_I(len(msg)))
+        parts.append(msg)
+        bundle_size += element_size
+        bundle_count += 1
+
+    if parts is not None:
+        dgrams.append((b"".join(parts), bundle_count))
+    return dgrams
+
+def bundle_value_offsets(dgram):
+    """Byte offset of the last 4 bytes (the float value) of each message in a bundle"""
+    offsets = []
+    pos = len(BUNDLE_HEADER)
+    while pos < len(dgram):
+        size = int.from_bytes(dgram[pos:pos + 4], 'big')
+        pos += 4 + size
+        offsets.append(pos - 4)
+    return offsets
+
+def build_bundle_template(addresses, value_messages):
+    """Lay out zero-valued float messages for addresses as writable bundles
+
+    value_messages lists, in ascending order, the indices of the addresses whose
+    value changes per frame; the others always send zero. Returns (bundles,
+    value_slots) for write_bundle_values() and frame_datagrams().
+    """
+    messages = [osc_float_prefix(address) + _PACK_F(0.0) for address in addresses]
+    bundles = [(bytearray(dgram), count) for dgram, count in build_frame_bundles(messages)]
+
+    # Each bundle holds a contiguous run of the changing messages, so it takes a slice
+    # of the value array, written through a big-endian float32 view at the value words
+    value_slots = []
+    first_message = 0
+    first_value = 0
+    for dgram, count in bundles:
+        message_offsets = bundle_value_offsets(dgram)
+        words = [message_offsets[m - first_message] // 4 for m in value_messages[first_value:]
+                 if m < first_message + count]
+        if words:
+            view = np.frombuffer(dgram, dtype='>f4')
+            value_slots.append((view, np.array(words, dtype=np.intp),
+                                first_value, first_value + len(words)))
+        first_message += count
+        first_value += len(words)
+    return bundles, value_slots
+
+def write_bundle_values(value_slots, values):
+    """Store one value per changing message into the template bundles"""
+    for view, words, start, stop in value_slots:
+        view[words] = values[start:stop]
+
+def frame_datagrams(bundles, control, copy=False):
+    """The template bundles plus the control messages, in the last bundle when they fit
+
+    With copy=True every datagram is a bytes copy, for frames that are sent after
+    the template has been rewritten.
+    """
+    dgrams = [(bytes(dgram) if copy else dgram, count) for dgram, count in bundles]
+    control_elements = b"".join(_PACK_I(len(msg)) + msg for msg in control)
+    if dgrams and len(dgrams[-1][0]) + len(control_elements) <= MAX_DATAGRAM_BYTES:
+        last_dgram, last_count = dgrams[-1]
+        dgrams[-1] = (last_dgram + control_elements, last_count + len(control))
+    else:
+        dgrams.extend(build_frame_bundles(control))
+    return dgrams
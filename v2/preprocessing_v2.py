@@ -87,8 +87,8 @@ def time_normalize_sequence(sequence, target_frames=60):
     t_original = np.linspace(0, 1, T)
     t_target = np.linspace(0, 1, target_frames)
     
-    # Interpolate each dimension
-    normalized = np.zeros((target_frames, D))
+    # Interpolate each dimension (kept float32 like the input, so the saved arrays are too)
+    normalized = np.zeros((target_frames, D), dtype=np.float32)
     for i in range(D):
         normalized[:, i] = np.interp(t_target, t_original, sequence[:, i])
     
@@ -3,7 +3,7 @@
 Generate PDF report from markdown summary
 """
 
-import markdown
+import sys
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -12,7 +12,33 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import re
 
-def markdown_to_pdf():
+from report_build import is_up_to_date, mark_built
+
+# Emoji in table cells push reportlab into per-glyph font fallback; use ASCII instead
+TABLE_GLYPHS = {
+    '✅': '[OK]',
+    '⚠️': '[!]',
+    '⚠': '[!]',
+    '❌': '[X]',
+    '⭐': '*',
+    '→': '->',
+}
+
+REPORT_SOURCES = ('V3_Summary_Report.md', __file__)
+
+def plain_cell(text):
+    """Strip markdown emphasis and emoji so a table cell stays a bare string"""
+    text = text.replace('**', '')
+    for glyph, ascii_text in TABLE_GLYPHS.items():
+        text = text.replace(glyph, ascii_text)
+    return text
+
+def markdown_to_pdf(force=False):
+    # Skip the layout pass entirely when the existing PDF is current
+    if not force and is_up_to_date('V3_Summary_Report.pdf', __file__, *REPORT_SOURCES):
+        print("✅ PDF report is up to date: V3_Summary_Report.pdf (use --force to rebuild)")
+        return
+    
     # Read the markdown file
     with open('V3_Summary_Report.md', 'r', encoding='utf-8') as f:
         markdown_content = f.read()
@@ -93,7 +119,7 @@ def markdown_to_pdf():
             while i < len(lines) and lines[i].strip().startswith('|'):
                 row = lines[i].strip()
                 if not row.startswith('|---'):  # Skip separator rows
-                    cells = [cell.strip() for cell in row.split('|')[1:-1]]
+                    cells = [plain_cell(cell.strip()) for cell in row.split('|')[1:-1]]
                     table_data.append(cells)
                 i += 1
             i -= 1  # Adjust for the loop increment
@@ -104,6 +130,7 @@ def markdown_to_pdf():
                     ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                     ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
                     ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
                     ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                     ('FONTSIZE', (0, 0), (-1, 0), 10),
                     ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
@@ -146,7 +173,8 @@ def markdown_to_pdf():
     
     # Build PDF
     doc.build(story)
+    mark_built('V3_Summary_Report.pdf', __file__, *REPORT_SOURCES)
     print("✅ PDF report generated: V3_Summary_Report.pdf")
 
 if __name__ == "__main__":
-    markdown_to_pdf()
+    markdown_to_pdf(force='--force' in sys.argv)
@@ -3,6 +3,7 @@
 Generate PDF report directly without markdown dependency
 """
 
+import sys
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -10,7 +11,14 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
-def generate_pdf():
+from report_build import is_up_to_date, mark_built
+
+def generate_pdf(force=False):
+    # The report content lives in this script, so it is the only source
+    if not force and is_up_to_date("V3_Summary_Report.pdf", __file__, __file__):
+        print("✅ PDF report is up to date: V3_Summary_Report.pdf (use --force to rebuild)")
+        return
+    
     # Create PDF
     doc = SimpleDocTemplate("V3_Summary_Report.pdf", pagesize=letter,
                           rightMargin=72, leftMargin=72,
@@ -101,7 +109,7 @@ def generate_pdf():
     # Create table
     table_data = [
         ['Component', 'Specification'],
-        ['Data Processing', '90 motion capture channels → 44 bone mappings'],
+        ['Data Processing', '90 motion capture channels -> 44 bone mappings'],
         ['ML Models', '3 GRU neural networks (baseline, left turn, right turn)'],
         ['OSC Messages', '44 bone messages + 1 pose command per frame'],
         ['Latency', '<16ms (real-time streaming)'],
@@ -113,6 +121,7 @@ def generate_pdf():
         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
         ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, 0), 10),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
@@ -176,7 +185,8 @@ def generate_pdf():
     
     # Build PDF
     doc.build(story)
+    mark_built("V3_Summary_Report.pdf", __file__, __file__)
     print("✅ PDF report generated: V3_Summary_Report.pdf")
 
 if __name__ == "__main__":
-    generate_pdf()
+    generate_pdf(force='--force' in sys.argv)
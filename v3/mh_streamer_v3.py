@@ -24,6 +24,10 @@ from sklearn.cluster import KMeans
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+# The OSC bundle encoder is shared with v2
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'v2'))
+from osc_bundles import build_bundle_template, frame_datagrams, osc_message, write_bundle_values
+
 # Configuration
 OSC_HOST = "127.0.0.1"
 OSC_PORT = 9000
@@ -148,6 +152,7 @@ class MetaHumanStreamerV3:
         # OSC channel configuration
         self.channels = []
         self.channel_mapping = {}  # Maps source columns to feature indices
+        self.frame_template = None  # Prebuilt channel bundles, see build_frame_template()
         
         # Streaming state
         self.is_streaming = False
@@ -631,6 +636,8 @@ class MetaHumanStreamerV3:
                     except ValueError:
                         self.log_message(f"Warning: Feature {source_column} not found in data")
             
+            self.frame_template = None
+            
             self.log_message(f"Loaded {len(self.channels)} OSC channels from {config_path}")
             self.log_message(f"Mapped {len(self.channel_mapping)} channels to features")
             return True
@@ -639,6 +646,52 @@ class MetaHumanStreamerV3:
             self.log_message(f"Error loading OSC channel config: {e}")
             return False
     
+    def build_frame_template(self, n_features):
+        """Lay out the channel bundles for frames of n_features values
+        
+        See build_bundle_template(). Unmapped channels keep sending zero; channels
+        mapped past the end of the frame are left out.
+        """
+        addresses = []
+        value_messages = []  # Message index of each mapped channel
+        feature_idx = []
+        scales = []
+        offsets = []
+        clamp_min = []
+        clamp_max = []
+        
+        for channel in self.channels:
+            idx = self.channel_mapping.get(channel['source_column'])
+            if idx is not None:
+                if idx >= n_features:
+                    continue
+                transform = channel['transform']
+                clamp = transform['clamp'] if transform['clamp'] is not None else (-np.inf, np.inf)
+                value_messages.append(len(addresses))
+                feature_idx.append(idx)
+                scales.append(transform['scale'])
+                offsets.append(transform['offset'])
+                clamp_min.append(clamp[0])
+                clamp_max.append(clamp[1])
+            addresses.append(channel['osc_address'])
+        
+        bundles, value_slots = build_bundle_template(addresses, value_messages)
+        
+        clamp_min = np.array(clamp_min, dtype=np.float64)
+        clamp_max = np.array(clamp_max, dtype=np.float64)
+        self.frame_template = {
+            'n_features': n_features,
+            'bundles': bundles,
+            'value_slots': value_slots,
+            'feature_idx': np.array(feature_idx, dtype=np.intp),
+            'scales': np.array(scales, dtype=np.float64),
+            'offsets': np.array(offsets, dtype=np.float64),
+            'clamp_min': clamp_min,
+            'clamp_max': clamp_max,
+            'clamped': bool(np.isfinite(clamp_min).any() or np.isfinite(clamp_max).any())
+        }
+        return self.frame_template
+    
     def generate_baseline_sequence(self):
         """Generate a baseline sequence for continuous streaming (same as v2)"""
         with torch.no_grad():
@@ -862,55 +915,31 @@ class MetaHumanStreamerV3:
             # Denormalize the data
             denormalized_data = self.denormalize_data(frame_data)
             
-            # Send data to configured OSC channels
-            success_count = 0
-            sample_values = []
+            template = self.frame_template
+            if template is None or template['n_features'] != len(denormalized_data):
+                template = self.build_frame_template(len(denormalized_data))
             
-            for channel in self.channels:
-                source_column = channel['source_column']
-                osc_address = channel['osc_address']
-                transform = channel['transform']
-                
-                # Get the feature value for this channel
-                if source_column in self.channel_mapping:
-                    feature_idx = self.channel_mapping[source_column]
-                    if feature_idx < len(denormalized_data):
-                        # Get raw value from data
-                        raw_value = denormalized_data[feature_idx]
-                        
-                        # Apply transform: scale * value + offset
-                        transformed_value = transform['scale'] * raw_value + transform['offset']
-                        
-                        # Apply clamping if specified
-                        if transform['clamp'] is not None:
-                            clamp_min, clamp_max = transform['clamp']
-                            transformed_value = max(clamp_min, min(clamp_max, transformed_value))
-                        
-                        try:
-                            # Send OSC message with proper address format
-                            self.osc_client.send_message(osc_address, float(transformed_value))
-                            success_count += 1
-                            sample_values.append(f"{transformed_value:.3f}")
-                        except Exception as e:
-                            self.osc_error_count += 1
-                            self.log_message(f"OSC send error for {osc_address}: {e}")
-                else:
-                    # Send zero if feature not found
-                    try:
-                        self.osc_client.send_message(osc_address, 0.0)
-                        success_count += 1
-                    except Exception as e:
-                        self.osc_error_count += 1
-                        self.log_message(f"OSC send error for {osc_address}: {e}")
+            # Apply transforms to all mapped channels at once: scale * value + offset, then clamp
+            values = template['scales'] * denormalized_data[template['feature_idx']] + template['offsets']
+            if template['clamped']:
+                np.clip(values, template['clamp_min'], template['clamp_max'], out=values)
+            sample_values = [f"{value:.3f}" for value in values[:5]]
             
-            # Send frame info (optional control messages)
-            try:
-                self.osc_client.send_message("/mh/frame", frame_count)
-                self.osc_client.send_message("/mh/mode", self.current_mode)
-                success_count += 2
-            except Exception as e:
-                self.osc_error_count += 1
-                self.log_message(f"OSC send error for control messages: {e}")
+            # Store the values into the prebuilt bundles (unmapped channels stay zero) and
+            # add the frame info (optional control messages)
+            write_bundle_values(template['value_slots'], values)
+            control = [osc_message("/mh/frame", frame_count), osc_message("/mh/mode", self.current_mode)]
+            dgrams = frame_datagrams(template['bundles'], control)
+            
+            # Send the frame as OSC bundles: one datagram unless it outgrows the MTU
+            success_count = 0
+            for dgram, count in dgrams:
+                try:
+                    self.osc_client._sock.sendto(dgram, (self.osc_client._address, self.osc_client._port))
+                    success_count += count
+                except Exception as e:
+                    self.osc_error_count += 1
+                    self.log_message(f"OSC send error for frame {frame_count}: {e}")
             
             # Update stats
             self.osc_send_count += success_count
@@ -979,7 +1008,7 @@ class MetaHumanStreamerV3:
             
             # Log data if enabled (every 30th frame to avoid spam)
             if self.show_data and frame_count % 30 == 0:
-                signal_name = mock_signals[0][0].split('/')[-1]  # Get signal name
+                signal_name = mock_signals[0][0].rpartition('/')[2]  # Get signal name
                 self.log_message(f"Mock Frame {frame_count} ({self.current_mode}): {signal_name}={value:.1f}°")
             
         except Exception as e:
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Skip rebuilding the V3 summary PDF when it is already current
+
+Both report generators write V3_Summary_Report.pdf, so a file timestamp alone
+cannot tell whose PDF is on disk. Each build records the generator and the
+modification times of its sources in a stamp next to the PDF.
+"""
+
+import json
+import os
+
+def _stamp_path(output_path):
+    return output_path + ".stamp"
+
+def _build_record(generator, source_paths):
+    return {
+        'generator': os.path.basename(generator),
+        'sources': {src: os.path.getmtime(src) if os.path.exists(src) else None
+                    for src in source_paths}
+    }
+
+def is_up_to_date(output_path, generator, *source_paths):
+    """True if output exists and was last built by generator from the current sources"""
+    if not os.path.exists(output_path):
+        return False
+    try:
+        with open(_stamp_path(output_path), 'r', encoding='utf-8') as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return stamp == _build_record(generator, source_paths)
+
+def mark_built(output_path, generator, *source_paths):
+    """Record that generator just built output from source_paths"""
+    with open(_stamp_path(output_path), 'w', encoding='utf-8') as f:
+        json.dump(_build_record(generator, source_paths), f)